@@ -0,0 +1,35 @@
+"""Add app_config indexes for category ordering and editable filtering
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index so ORDER BY (category, key) and DISTINCT category
+    # use an index scan instead of an explicit sort
+    op.create_index('ix_app_config_category_key', 'app_config', ['category', 'key'])
+
+    # Partial index to accelerate bulk-update filtering on editable keys
+    op.create_index(
+        'ix_app_config_editable',
+        'app_config',
+        ['key'],
+        postgresql_where=sa.text('is_editable'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_app_config_editable', table_name='app_config')
+    op.drop_index('ix_app_config_category_key', table_name='app_config')
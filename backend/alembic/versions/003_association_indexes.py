@@ -0,0 +1,38 @@
+"""Add reverse-direction association indexes and active reset-token index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite PKs (user_id, role_id) / (role_id, permission_id)
+    # cover forward lookups by left prefix; these cover the reverse
+    # joins used by the role admin screens
+    op.create_index('ix_user_roles_role_id', 'user_roles', ['role_id'])
+    op.create_index('ix_role_permissions_permission_id', 'role_permissions', ['permission_id'])
+
+    # Partial index keeps hot reset-token lookups off used rows
+    op.create_index(
+        'ix_password_reset_active',
+        'password_reset_tokens',
+        ['token'],
+        postgresql_where=sa.text('used = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_password_reset_active', table_name='password_reset_tokens')
+    op.drop_index('ix_role_permissions_permission_id', table_name='role_permissions')
+    op.drop_index('ix_user_roles_role_id', table_name='user_roles')
@@ -0,0 +1,44 @@
+"""Server-side defaults for created_at/updated_at timestamps
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# timezone('utc', now()) keeps stored values naive-UTC, matching the
+# datetime.utcnow() convention the application compares against
+_UTC_NOW = sa.text("timezone('utc', now())")
+
+_COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('roles', 'created_at'),
+    ('roles', 'updated_at'),
+    ('permissions', 'created_at'),
+    ('permissions', 'updated_at'),
+    ('app_config', 'created_at'),
+    ('app_config', 'updated_at'),
+    ('password_reset_tokens', 'created_at'),
+    ('role_permissions', 'created_at'),
+    ('user_roles', 'assigned_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=_UTC_NOW)
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,66 @@
+"""Store SHA-256 digests of password reset tokens instead of plaintext
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Plaintext tokens cannot be migrated to digests; outstanding reset
+    # links are invalidated (short-lived by design, worst case the user
+    # requests a new one)
+    op.execute("DELETE FROM password_reset_tokens")
+
+    op.drop_index('ix_password_reset_active', table_name='password_reset_tokens')
+    op.drop_index('ix_password_reset_tokens_token', table_name='password_reset_tokens')
+    op.drop_column('password_reset_tokens', 'token')
+
+    op.add_column(
+        'password_reset_tokens',
+        sa.Column('token_hash', sa.LargeBinary(32), nullable=False),
+    )
+    op.create_index(
+        'ix_password_reset_tokens_token_hash',
+        'password_reset_tokens',
+        ['token_hash'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_password_reset_active',
+        'password_reset_tokens',
+        ['token_hash'],
+        postgresql_where=sa.text('used = false'),
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM password_reset_tokens")
+
+    op.drop_index('ix_password_reset_active', table_name='password_reset_tokens')
+    op.drop_index('ix_password_reset_tokens_token_hash', table_name='password_reset_tokens')
+    op.drop_column('password_reset_tokens', 'token_hash')
+
+    op.add_column(
+        'password_reset_tokens',
+        sa.Column('token', sa.String(255), nullable=False),
+    )
+    op.create_index(
+        'ix_password_reset_tokens_token', 'password_reset_tokens', ['token'], unique=True,
+    )
+    op.create_index(
+        'ix_password_reset_active',
+        'password_reset_tokens',
+        ['token'],
+        postgresql_where=sa.text('used = false'),
+    )
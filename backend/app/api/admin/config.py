@@ -3,12 +3,18 @@ Admin API endpoints for managing application configuration.
 """
 
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional, List
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, case
+from redis import asyncio as aioredis
 
+from app.config import settings
 from app.database import get_db
 from app.models.config import AppConfig, DEFAULT_CONFIG
 from app.models.user import User
@@ -17,6 +23,20 @@ from app.api.auth import get_current_admin_user
 
 router = APIRouter()
 
+# Redis cache for config reads (config changes rarely, reads are frequent)
+CONFIG_CACHE_KEY = "config:all"
+CONFIG_CACHE_TTL = 60  # seconds
+
+_redis_client: Optional[aioredis.Redis] = None
+
+
+def _get_redis() -> aioredis.Redis:
+    """Get (or lazily create) the shared async Redis client."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(settings.redis_url)
+    return _redis_client
+
 
 # Pydantic Schemas
 class ConfigItemResponse(BaseModel):
@@ -33,6 +53,30 @@ class ConfigItemResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_model(cls, config: AppConfig) -> "ConfigItemResponse":
+        """Build a response from an AppConfig row, masking secret values.
+
+        Uses model_construct to skip validation — attributes are already typed.
+        """
+        # display_value is computed by the database on SELECT; rows coming
+        # from UPDATE ... RETURNING don't carry it, so mask in Python there
+        if "display_value" in config.__dict__:
+            value = config.display_value
+        else:
+            value = "********" if config.is_secret and config.value else config.value
+        return cls.model_construct(
+            id=str(config.id),
+            key=config.key,
+            value=value,
+            description=config.description,
+            value_type=config.value_type,
+            category=config.category,
+            is_secret=config.is_secret,
+            is_editable=config.is_editable,
+            updated_at=config.updated_at
+        )
+
 
 class ConfigItemUpdate(BaseModel):
     value: Optional[str]
@@ -47,36 +91,60 @@ class ConfigCategoryResponse(BaseModel):
     items: List[ConfigItemResponse]
 
 
+async def _cached_configs(db: AsyncSession) -> List[dict]:
+    """Get all config items as response dicts, cached in Redis with a TTL.
+
+    Values are already masked for secrets. Falls back to the database if
+    Redis is unavailable.
+    """
+    try:
+        cached = await _get_redis().get(CONFIG_CACHE_KEY)
+        if cached:
+            return orjson.loads(cached)
+    except Exception:
+        pass  # Redis unavailable - fall through to DB
+
+    # Stream in batches instead of materializing every row at once
+    result = await db.stream(
+        select(AppConfig)
+        .order_by(AppConfig.category, AppConfig.key)
+        .execution_options(yield_per=500)
+    )
+    items = [
+        ConfigItemResponse.from_model(config).model_dump()
+        async for config in result.scalars()
+    ]
+
+    try:
+        await _get_redis().set(CONFIG_CACHE_KEY, orjson.dumps(items), ex=CONFIG_CACHE_TTL)
+    except Exception:
+        pass  # Caching is best-effort
+
+    return items
+
+
+async def _invalidate_config_cache() -> None:
+    """Drop the cached config after any write."""
+    try:
+        await _get_redis().delete(CONFIG_CACHE_KEY)
+    except Exception:
+        pass
+
+
 # Routes
-@router.get("", response_model=List[ConfigItemResponse])
+# Read endpoints return pre-built dicts via ORJSONResponse, skipping the
+# Pydantic response-validation roundtrip on the hot paths
+@router.get("", response_class=ORJSONResponse)
 async def list_all_config(
     category: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """Get all configuration items, optionally filtered by category."""
-    query = select(AppConfig)
+    items = await _cached_configs(db)
     if category:
-        query = query.where(AppConfig.category == category)
-    query = query.order_by(AppConfig.category, AppConfig.key)
-
-    result = await db.execute(query)
-    configs = result.scalars().all()
-
-    return [
-        ConfigItemResponse(
-            id=str(config.id),
-            key=config.key,
-            value="********" if config.is_secret and config.value else config.value,
-            description=config.description,
-            value_type=config.value_type,
-            category=config.category,
-            is_secret=config.is_secret,
-            is_editable=config.is_editable,
-            updated_at=config.updated_at
-        )
-        for config in configs
-    ]
+        items = [item for item in items if item["category"] == category]
+    return items
 
 
 @router.get("/categories", response_model=List[str])
@@ -85,55 +153,38 @@ async def list_categories(
     current_user: User = Depends(get_current_admin_user)
 ):
     """Get list of all configuration categories."""
-    result = await db.execute(
-        select(AppConfig.category).distinct().order_by(AppConfig.category)
-    )
-    return [row[0] for row in result.all()]
+    # Derive from the cached config list instead of a per-request DISTINCT scan
+    items = await _cached_configs(db)
+    return sorted({item["category"] for item in items})
 
 
-@router.get("/by-category", response_model=List[ConfigCategoryResponse])
+@router.get("/by-category", response_class=ORJSONResponse)
 async def get_config_by_category(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """Get all configuration items grouped by category."""
-    result = await db.execute(
-        select(AppConfig).order_by(AppConfig.category, AppConfig.key)
-    )
-    configs = result.scalars().all()
-
-    # Group by category
-    categories_dict = {}
-    for config in configs:
-        if config.category not in categories_dict:
-            categories_dict[config.category] = []
-        categories_dict[config.category].append(
-            ConfigItemResponse(
-                id=str(config.id),
-                key=config.key,
-                value="********" if config.is_secret and config.value else config.value,
-                description=config.description,
-                value_type=config.value_type,
-                category=config.category,
-                is_secret=config.is_secret,
-                is_editable=config.is_editable,
-                updated_at=config.updated_at
-            )
-        )
+    items = await _cached_configs(db)
 
+    # Items are already sorted by (category, key), so group contiguous runs
     return [
-        ConfigCategoryResponse(category=cat, items=items)
-        for cat, items in categories_dict.items()
+        {"category": category, "items": list(group)}
+        for category, group in groupby(items, key=itemgetter("category"))
     ]
 
 
-@router.get("/{key}", response_model=ConfigItemResponse)
+@router.get("/{key}", response_class=ORJSONResponse)
 async def get_config_item(
     key: str,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """Get a specific configuration item by key."""
+    for item in await _cached_configs(db):
+        if item["key"] == key:
+            return item
+
+    # Not in cache - check the database before reporting 404
     result = await db.execute(select(AppConfig).where(AppConfig.key == key))
     config = result.scalar_one_or_none()
 
@@ -143,99 +194,78 @@ async def get_config_item(
             detail=f"Configuration key '{key}' not found"
         )
 
-    return ConfigItemResponse(
-        id=str(config.id),
-        key=config.key,
-        value="********" if config.is_secret and config.value else config.value,
-        description=config.description,
-        value_type=config.value_type,
-        category=config.category,
-        is_secret=config.is_secret,
-        is_editable=config.is_editable,
-        updated_at=config.updated_at
-    )
+    return ConfigItemResponse.from_model(config).model_dump()
 
 
 @router.put("/{key}", response_model=ConfigItemResponse)
 async def update_config_item(
     key: str,
-    update: ConfigItemUpdate,
+    payload: ConfigItemUpdate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """Update a specific configuration item."""
-    result = await db.execute(select(AppConfig).where(AppConfig.key == key))
+    # Single UPDATE ... RETURNING roundtrip on the happy path; the extra
+    # SELECT only runs to pick the right error when nothing was updated
+    stmt = (
+        update(AppConfig)
+        .where(AppConfig.key == key, AppConfig.is_editable.is_(True))
+        # updated_at comes from the column's onupdate (UTC_NOW); a bare
+        # now() here would write server-local time into a naive column
+        .values(value=payload.value)
+        .returning(AppConfig)
+    )
+    result = await db.execute(stmt)
     config = result.scalar_one_or_none()
 
     if not config:
+        result = await db.execute(select(AppConfig).where(AppConfig.key == key))
+        if result.scalar_one_or_none():
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Configuration key '{key}' is not editable"
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Configuration key '{key}' not found"
         )
 
-    if not config.is_editable:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Configuration key '{key}' is not editable"
-        )
-
-    config.value = update.value
-    config.updated_at = datetime.utcnow()
     await db.commit()
-    await db.refresh(config)
-
-    return ConfigItemResponse(
-        id=str(config.id),
-        key=config.key,
-        value="********" if config.is_secret and config.value else config.value,
-        description=config.description,
-        value_type=config.value_type,
-        category=config.category,
-        is_secret=config.is_secret,
-        is_editable=config.is_editable,
-        updated_at=config.updated_at
-    )
+
+    await _invalidate_config_cache()
+
+    return ConfigItemResponse.from_model(config)
 
 
 @router.put("", response_model=List[ConfigItemResponse])
 async def bulk_update_config(
-    update: ConfigBulkUpdate,
+    payload: ConfigBulkUpdate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """Bulk update multiple configuration items."""
-    updated_configs = []
-
-    for key, value in update.configs.items():
-        result = await db.execute(select(AppConfig).where(AppConfig.key == key))
-        config = result.scalar_one_or_none()
-
-        if not config:
-            continue  # Skip non-existent keys
-
-        if not config.is_editable:
-            continue  # Skip non-editable keys
-
-        config.value = value
-        config.updated_at = datetime.utcnow()
-        updated_configs.append(config)
+    if not payload.configs:
+        return []
+
+    # Single UPDATE with a CASE over the keys; non-existent and non-editable
+    # keys are filtered server-side and simply skipped
+    stmt = (
+        update(AppConfig)
+        .where(
+            AppConfig.key.in_(list(payload.configs.keys())),
+            AppConfig.is_editable.is_(True),
+        )
+        .values(value=case(payload.configs, value=AppConfig.key))
+        .returning(AppConfig)
+    )
+    result = await db.execute(stmt)
+    updated_configs = result.scalars().all()
 
     await db.commit()
 
-    return [
-        ConfigItemResponse(
-            id=str(config.id),
-            key=config.key,
-            value="********" if config.is_secret and config.value else config.value,
-            description=config.description,
-            value_type=config.value_type,
-            category=config.category,
-            is_secret=config.is_secret,
-            is_editable=config.is_editable,
-            updated_at=config.updated_at
-        )
-        for config in updated_configs
-    ]
+    await _invalidate_config_cache()
+
+    return [ConfigItemResponse.from_model(config) for config in updated_configs]
 
 
 @router.post("/clear-cache", response_model=dict)
@@ -244,39 +274,34 @@ async def clear_cache_and_seed(
     current_user: User = Depends(get_current_admin_user)
 ):
     """Clear Redis cache and seed default configuration values."""
-    import redis
-    from app.config import settings
-
-    # Clear Redis cache
+    # Clear Redis cache (async client so the flush doesn't block the event loop)
     cache_cleared = False
     try:
-        r = redis.from_url(settings.redis_url)
-        r.flushdb()
+        r = aioredis.from_url(settings.redis_url)
+        await r.flushdb(asynchronous=True)
+        await r.aclose()
         cache_cleared = True
     except Exception as e:
         # Log but don't fail if Redis is unavailable
         pass
 
-    # Seed missing config values
-    added = 0
-    skipped = 0
+    # Seed missing config values: one query for existing keys, one bulk insert
+    all_keys = [config_data["key"] for config_data in DEFAULT_CONFIG]
+    result = await db.execute(select(AppConfig.key).where(AppConfig.key.in_(all_keys)))
+    existing_keys = set(result.scalars().all())
 
-    for config_data in DEFAULT_CONFIG:
-        result = await db.execute(
-            select(AppConfig).where(AppConfig.key == config_data["key"])
-        )
-        existing = result.scalar_one_or_none()
+    new_rows = [dict(c) for c in DEFAULT_CONFIG if c["key"] not in existing_keys]
 
-        if existing:
-            skipped += 1
-            continue
+    if new_rows:
+        await db.execute(insert(AppConfig), new_rows)
 
-        config = AppConfig(**config_data)
-        db.add(config)
-        added += 1
+    added = len(new_rows)
+    skipped = len(all_keys) - added
 
     await db.commit()
 
+    await _invalidate_config_cache()
+
     return {
         "cache_cleared": cache_cleared,
         "added": added,
@@ -1,13 +1,17 @@
 """Admin API for managing roles, permissions, and user role assignments"""
 
+import time
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, delete, insert, bindparam, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload, joinedload, raiseload, noload
 
 from app.database import get_db
 from app.api.auth import get_current_admin_user
@@ -15,7 +19,16 @@ from app.models.user import User
 from app.models.rbac import Role, Permission, role_permissions, user_roles
 from app.utils.permissions import require_permission, Permissions
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# TTL cache for the distinct resource/action lists served by the utility
+# endpoints below; cleared whenever a permission is created/updated/deleted
+_RESOURCE_ACTION_TTL = 60  # seconds
+_resource_action_cache: dict = {}
+
+
+def _invalidate_resource_action_cache() -> None:
+    _resource_action_cache.clear()
 
 
 # ============= Pydantic Schemas =============
@@ -29,7 +42,12 @@ class PermissionCreate(BaseModel):
     is_active: bool = True
 
 
+# Rarely-hit request schemas defer their pydantic-core build to first use
+# instead of paying it at import time
+
 class PermissionUpdate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     display_name: Optional[str] = None
     description: Optional[str] = None
     is_active: Optional[bool] = None
@@ -55,11 +73,13 @@ class RoleCreate(BaseModel):
     description: Optional[str] = None
     priority: int = 0
     is_active: bool = True
-    permission_ids: Optional[List[str]] = None
+    permission_ids: Optional[List[UUID]] = None  # parsed once by pydantic-core
     copy_from_role_id: Optional[str] = None  # Copy permissions from existing role
 
 
 class RoleUpdate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: Optional[str] = None
     display_name: Optional[str] = None
     description: Optional[str] = None
@@ -85,11 +105,15 @@ class RoleResponse(BaseModel):
 
 
 class RolePermissionUpdate(BaseModel):
-    permission_ids: List[str]
+    model_config = ConfigDict(defer_build=True)
+
+    permission_ids: List[UUID]
 
 
 class UserRoleAssignment(BaseModel):
-    role_ids: List[str]
+    model_config = ConfigDict(defer_build=True)
+
+    role_ids: List[UUID]
 
 
 class UserRoleResponse(BaseModel):
@@ -102,10 +126,36 @@ class UserRoleResponse(BaseModel):
         from_attributes = True
 
 
+# Module-level adapters: built once at import, then reused for batched
+# list serialization without FastAPI's per-request field introspection
+_PERMISSION_LIST_ADAPTER = TypeAdapter(List[PermissionResponse])
+_ROLE_LIST_ADAPTER = TypeAdapter(List[RoleResponse])
+
+
+# Hot single-row lookups compiled once at import; the engine's compiled
+# cache then serves every execution without re-running the ORM compiler
+_GET_PERMISSION_BY_ID = select(Permission).where(
+    Permission.id == bindparam("permission_id")
+)
+_GET_ROLE_WITH_PERMS = (
+    select(Role)
+    .options(selectinload(Role.permissions), raiseload("*"))
+    .where(Role.id == bindparam("role_id"))
+)
+_GET_USER_WITH_ROLES = (
+    select(User)
+    .options(selectinload(User.roles), raiseload("*"))
+    .where(User.id == bindparam("user_id"))
+)
+
+
 # ============= Helper Functions =============
 
+# These helpers convert trusted ORM rows, so model_construct skips the
+# pydantic validation pass; UUIDs are stringified explicitly.
+
 def permission_to_response(permission: Permission) -> PermissionResponse:
-    return PermissionResponse(
+    return PermissionResponse.model_construct(
         id=str(permission.id),
         name=permission.name,
         display_name=permission.display_name,
@@ -117,8 +167,25 @@ def permission_to_response(permission: Permission) -> PermissionResponse:
     )
 
 
-def role_to_response(role: Role, user_count: int = 0) -> RoleResponse:
-    return RoleResponse(
+def role_to_response(
+    role: Role,
+    user_count: int = 0,
+    perm_cache: Optional[dict] = None,
+) -> RoleResponse:
+    # perm_cache lets callers converting many roles build each shared
+    # PermissionResponse only once per request
+    if perm_cache is not None:
+        # Explicit membership check: setdefault would still construct the
+        # response per role and only discard it on a cache hit
+        permissions = []
+        for p in role.permissions:
+            if p.id not in perm_cache:
+                perm_cache[p.id] = permission_to_response(p)
+            permissions.append(perm_cache[p.id])
+    else:
+        permissions = [permission_to_response(p) for p in role.permissions] if role.permissions else []
+
+    return RoleResponse.model_construct(
         id=str(role.id),
         name=role.name,
         display_name=role.display_name,
@@ -126,7 +193,7 @@ def role_to_response(role: Role, user_count: int = 0) -> RoleResponse:
         is_system=role.is_system,
         priority=role.priority,
         is_active=role.is_active,
-        permissions=[permission_to_response(p) for p in role.permissions] if role.permissions else [],
+        permissions=permissions,
         user_count=user_count,
         created_at=role.created_at,
         updated_at=role.updated_at,
@@ -155,7 +222,10 @@ async def list_permissions(
     result = await db.execute(query)
     permissions = result.scalars().all()
 
-    return [permission_to_response(p) for p in permissions]
+    return Response(
+        _PERMISSION_LIST_ADAPTER.dump_json([permission_to_response(p) for p in permissions]),
+        media_type="application/json",
+    )
 
 
 @router.post("/permissions", response_model=PermissionResponse)
@@ -165,23 +235,6 @@ async def create_permission(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new permission"""
-    # Check for duplicate name
-    result = await db.execute(
-        select(Permission).where(Permission.name == data.name)
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Permission with this name already exists")
-
-    # Check for duplicate resource:action
-    result = await db.execute(
-        select(Permission).where(
-            Permission.resource == data.resource,
-            Permission.action == data.action
-        )
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail=f"Permission {data.resource}:{data.action} already exists")
-
     permission = Permission(
         name=data.name,
         display_name=data.display_name,
@@ -192,9 +245,21 @@ async def create_permission(
     )
 
     db.add(permission)
-    await db.commit()
+    # Rely on the unique constraints instead of racy pre-flight SELECTs
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if "uq_permission_resource_action" in str(exc.orig):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Permission {data.resource}:{data.action} already exists"
+            )
+        raise HTTPException(status_code=400, detail="Permission with this name already exists")
     await db.refresh(permission)
 
+    _invalidate_resource_action_cache()
+
     return permission_to_response(permission)
 
 
@@ -205,9 +270,7 @@ async def get_permission(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific permission"""
-    result = await db.execute(
-        select(Permission).where(Permission.id == permission_id)
-    )
+    result = await db.execute(_GET_PERMISSION_BY_ID, {"permission_id": permission_id})
     permission = result.scalar_one_or_none()
 
     if not permission:
@@ -224,9 +287,7 @@ async def update_permission(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a permission (cannot change name, resource, or action)"""
-    result = await db.execute(
-        select(Permission).where(Permission.id == permission_id)
-    )
+    result = await db.execute(_GET_PERMISSION_BY_ID, {"permission_id": permission_id})
     permission = result.scalar_one_or_none()
 
     if not permission:
@@ -242,6 +303,8 @@ async def update_permission(
     await db.commit()
     await db.refresh(permission)
 
+    _invalidate_resource_action_cache()
+
     return permission_to_response(permission)
 
 
@@ -252,9 +315,7 @@ async def delete_permission(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a permission"""
-    result = await db.execute(
-        select(Permission).where(Permission.id == permission_id)
-    )
+    result = await db.execute(_GET_PERMISSION_BY_ID, {"permission_id": permission_id})
     permission = result.scalar_one_or_none()
 
     if not permission:
@@ -263,6 +324,8 @@ async def delete_permission(
     await db.delete(permission)
     await db.commit()
 
+    _invalidate_resource_action_cache()
+
     return {"message": "Permission deleted successfully"}
 
 
@@ -278,7 +341,7 @@ async def list_roles(
     """List all roles with their permissions. Superadmin role excluded by default."""
     query = (
         select(Role)
-        .options(selectinload(Role.permissions))
+        .options(selectinload(Role.permissions), raiseload("*"))
     )
 
     # Filter out superadmin role unless explicitly requested
@@ -293,16 +356,23 @@ async def list_roles(
     result = await db.execute(query)
     roles = result.scalars().all()
 
-    # Get user counts for each role
-    role_user_counts = {}
-    for role in roles:
-        count_query = select(func.count()).select_from(user_roles).where(
-            user_roles.c.role_id == role.id
-        )
-        count_result = await db.execute(count_query)
-        role_user_counts[role.id] = count_result.scalar() or 0
+    # Get user counts for all roles in one GROUP BY instead of a query per role
+    counts_query = (
+        select(user_roles.c.role_id, func.count().label("user_count"))
+        .where(user_roles.c.role_id.in_([role.id for role in roles]))
+        .group_by(user_roles.c.role_id)
+    )
+    counts_result = await db.execute(counts_query)
+    role_user_counts = {row.role_id: row.user_count for row in counts_result}
 
-    return [role_to_response(r, role_user_counts.get(r.id, 0)) for r in roles]
+    perm_cache: dict = {}
+    return Response(
+        _ROLE_LIST_ADAPTER.dump_json([
+            role_to_response(r, role_user_counts.get(r.id, 0), perm_cache=perm_cache)
+            for r in roles
+        ]),
+        media_type="application/json",
+    )
 
 
 @router.post("/roles", response_model=RoleResponse)
@@ -312,22 +382,6 @@ async def create_role(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new role with optional permissions. Can copy permissions from an existing role."""
-    # Check for duplicate name
-    result = await db.execute(
-        select(Role).where(Role.name == data.name)
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Role with this name already exists")
-
-    role = Role(
-        name=data.name,
-        display_name=data.display_name,
-        description=data.description,
-        priority=data.priority,
-        is_active=data.is_active,
-        is_system=False,
-    )
-
     # Determine permissions to assign
     permissions_to_add = []
 
@@ -335,7 +389,7 @@ async def create_role(
     if data.copy_from_role_id:
         result = await db.execute(
             select(Role)
-            .options(selectinload(Role.permissions))
+            .options(selectinload(Role.permissions), raiseload("*"))
             .where(Role.id == UUID(data.copy_from_role_id))
         )
         source_role = result.scalar_one_or_none()
@@ -346,7 +400,7 @@ async def create_role(
     # If explicit permission_ids provided, they override or add to copied ones
     if data.permission_ids:
         result = await db.execute(
-            select(Permission).where(Permission.id.in_([UUID(pid) for pid in data.permission_ids]))
+            select(Permission).where(Permission.id.in_(data.permission_ids))
         )
         explicit_permissions = result.scalars().all()
         # Merge: explicit permissions take precedence
@@ -355,21 +409,49 @@ async def create_role(
             if perm.id not in existing_ids:
                 permissions_to_add.append(perm)
 
-    role.permissions = permissions_to_add
-
-    db.add(role)
-    await db.commit()
-    await db.refresh(role)
+    # Everything the response needs is already in memory, so a Core INSERT
+    # with RETURNING for the generated fields avoids the refresh + reload
+    # round-trips. Duplicate names are rejected by the unique constraint.
+    stmt = (
+        insert(Role)
+        .values(
+            name=data.name,
+            display_name=data.display_name,
+            description=data.description,
+            priority=data.priority,
+            is_active=data.is_active,
+            is_system=False,
+        )
+        .returning(Role.id, Role.created_at, Role.updated_at)
+    )
+    try:
+        row = (await db.execute(stmt)).one()
+        if permissions_to_add:
+            await db.execute(
+                insert(role_permissions),
+                [
+                    {"role_id": row.id, "permission_id": p.id}
+                    for p in permissions_to_add
+                ],
+            )
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Role with this name already exists")
 
-    # Reload with permissions
-    result = await db.execute(
-        select(Role)
-        .options(selectinload(Role.permissions))
-        .where(Role.id == role.id)
+    return RoleResponse.model_construct(
+        id=str(row.id),
+        name=data.name,
+        display_name=data.display_name,
+        description=data.description,
+        is_system=False,
+        priority=data.priority,
+        is_active=data.is_active,
+        permissions=[permission_to_response(p) for p in permissions_to_add],
+        user_count=0,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
     )
-    role = result.scalar_one()
-
-    return role_to_response(role)
 
 
 @router.get("/roles/{role_id}", response_model=RoleResponse)
@@ -379,24 +461,21 @@ async def get_role(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific role with its permissions"""
+    # Role row and user count in one statement; grouping by the primary
+    # key lets Postgres project the remaining columns directly
     result = await db.execute(
-        select(Role)
-        .options(selectinload(Role.permissions))
+        select(Role, func.count(user_roles.c.user_id).label("user_count"))
+        .options(selectinload(Role.permissions), raiseload("*"))
+        .outerjoin(user_roles, user_roles.c.role_id == Role.id)
         .where(Role.id == role_id)
+        .group_by(Role.id)
     )
-    role = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not role:
+    if row is None:
         raise HTTPException(status_code=404, detail="Role not found")
 
-    # Get user count
-    count_query = select(func.count()).select_from(user_roles).where(
-        user_roles.c.role_id == role.id
-    )
-    count_result = await db.execute(count_query)
-    user_count = count_result.scalar() or 0
-
-    return role_to_response(role, user_count)
+    return role_to_response(row.Role, row.user_count)
 
 
 @router.patch("/roles/{role_id}", response_model=RoleResponse)
@@ -407,11 +486,7 @@ async def update_role(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a role (cannot modify system roles except is_active)"""
-    result = await db.execute(
-        select(Role)
-        .options(selectinload(Role.permissions))
-        .where(Role.id == role_id)
-    )
+    result = await db.execute(_GET_ROLE_WITH_PERMS, {"role_id": role_id})
     role = result.scalar_one_or_none()
 
     if not role:
@@ -474,6 +549,32 @@ async def delete_role(
 
 # ============= Role Permission Management =============
 
+async def _get_role_and_permission(
+    db: AsyncSession, role_id: UUID, permission_id: UUID
+) -> tuple:
+    """Fetch a role and a permission in one round trip, raising 404 if missing."""
+    # Explicit ON TRUE join: the two PK filters make this a 1x1 cross
+    # join by construction, and spelling it out keeps SQLAlchemy's
+    # cartesian-product SAWarning out of the logs on this hot path
+    result = await db.execute(
+        select(Role, Permission)
+        .join(Permission, true())
+        .options(noload(Role.permissions))
+        .where(Role.id == role_id, Permission.id == permission_id)
+    )
+    row = result.one_or_none()
+
+    if row is None:
+        # Rare path: one targeted query to report which entity is missing
+        result = await db.execute(select(Role.id).where(Role.id == role_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Role not found")
+        raise HTTPException(status_code=404, detail="Permission not found")
+
+    return row.Role, row.Permission
+
+
+
 @router.put("/roles/{role_id}/permissions", response_model=RoleResponse)
 async def set_role_permissions(
     role_id: UUID,
@@ -482,11 +583,7 @@ async def set_role_permissions(
     db: AsyncSession = Depends(get_db)
 ):
     """Set all permissions for a role (replaces existing)"""
-    result = await db.execute(
-        select(Role)
-        .options(selectinload(Role.permissions))
-        .where(Role.id == role_id)
-    )
+    result = await db.execute(_GET_ROLE_WITH_PERMS, {"role_id": role_id})
     role = result.scalar_one_or_none()
 
     if not role:
@@ -495,14 +592,14 @@ async def set_role_permissions(
     if role.is_system:
         raise HTTPException(status_code=400, detail="Cannot modify permissions of system role")
 
-    # Get requested permissions
-    result = await db.execute(
-        select(Permission).where(Permission.id.in_([UUID(pid) for pid in data.permission_ids]))
-    )
-    permissions = result.scalars().all()
-
-    # Replace permissions
-    role.permissions = list(permissions)
+    # Replace permissions; "revoke all" skips the pointless IN () query
+    if not data.permission_ids:
+        role.permissions = []
+    else:
+        result = await db.execute(
+            select(Permission).where(Permission.id.in_(data.permission_ids))
+        )
+        role.permissions = list(result.scalars().all())
 
     await db.commit()
     await db.refresh(role)
@@ -518,30 +615,19 @@ async def add_permission_to_role(
     db: AsyncSession = Depends(get_db)
 ):
     """Add a single permission to a role"""
-    result = await db.execute(
-        select(Role)
-        .options(selectinload(Role.permissions))
-        .where(Role.id == role_id)
-    )
-    role = result.scalar_one_or_none()
-
-    if not role:
-        raise HTTPException(status_code=404, detail="Role not found")
+    # No need to materialize the permissions collection for a membership
+    # change; an idempotent INSERT on the association table does it in one trip
+    role, permission = await _get_role_and_permission(db, role_id, permission_id)
 
     if role.is_system:
         raise HTTPException(status_code=400, detail="Cannot modify permissions of system role")
 
-    result = await db.execute(
-        select(Permission).where(Permission.id == permission_id)
+    await db.execute(
+        pg_insert(role_permissions)
+        .values(role_id=role_id, permission_id=permission_id)
+        .on_conflict_do_nothing()
     )
-    permission = result.scalar_one_or_none()
-
-    if not permission:
-        raise HTTPException(status_code=404, detail="Permission not found")
-
-    if permission not in role.permissions:
-        role.permissions.append(permission)
-        await db.commit()
+    await db.commit()
 
     return {"message": f"Permission '{permission.name}' added to role '{role.name}'"}
 
@@ -554,30 +640,18 @@ async def remove_permission_from_role(
     db: AsyncSession = Depends(get_db)
 ):
     """Remove a permission from a role"""
-    result = await db.execute(
-        select(Role)
-        .options(selectinload(Role.permissions))
-        .where(Role.id == role_id)
-    )
-    role = result.scalar_one_or_none()
-
-    if not role:
-        raise HTTPException(status_code=404, detail="Role not found")
+    role, permission = await _get_role_and_permission(db, role_id, permission_id)
 
     if role.is_system:
         raise HTTPException(status_code=400, detail="Cannot modify permissions of system role")
 
-    result = await db.execute(
-        select(Permission).where(Permission.id == permission_id)
+    await db.execute(
+        delete(role_permissions).where(
+            role_permissions.c.role_id == role_id,
+            role_permissions.c.permission_id == permission_id,
+        )
     )
-    permission = result.scalar_one_or_none()
-
-    if not permission:
-        raise HTTPException(status_code=404, detail="Permission not found")
-
-    if permission in role.permissions:
-        role.permissions.remove(permission)
-        await db.commit()
+    await db.commit()
 
     return {"message": f"Permission '{permission.name}' removed from role '{role.name}'"}
 
@@ -591,12 +665,13 @@ async def get_user_roles(
     db: AsyncSession = Depends(get_db)
 ):
     """Get all roles assigned to a user"""
+    # Single-user endpoint: one joined query beats two selectin follow-ups
     result = await db.execute(
         select(User)
-        .options(selectinload(User.roles).selectinload(Role.permissions))
+        .options(joinedload(User.roles).joinedload(Role.permissions), raiseload("*"))
         .where(User.id == user_id)
     )
-    user = result.scalar_one_or_none()
+    user = result.unique().scalar_one_or_none()
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -617,26 +692,22 @@ async def set_user_roles(
     db: AsyncSession = Depends(get_db)
 ):
     """Set all roles for a user (replaces existing)"""
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.roles))
-        .where(User.id == user_id)
-    )
+    result = await db.execute(_GET_USER_WITH_ROLES, {"user_id": user_id})
     user = result.scalar_one_or_none()
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Get requested roles
-    result = await db.execute(
-        select(Role)
-        .options(selectinload(Role.permissions))
-        .where(Role.id.in_([UUID(rid) for rid in data.role_ids]))
-    )
-    roles = result.scalars().all()
-
-    # Replace roles
-    user.roles = list(roles)
+    # Replace roles; "revoke all" skips the pointless IN () query
+    if not data.role_ids:
+        user.roles = []
+    else:
+        result = await db.execute(
+            select(Role)
+            .options(selectinload(Role.permissions), raiseload("*"))
+            .where(Role.id.in_(data.role_ids))
+        )
+        user.roles = list(result.scalars().all())
 
     await db.commit()
     await db.refresh(user)
@@ -658,9 +729,7 @@ async def add_role_to_user(
 ):
     """Add a single role to a user"""
     result = await db.execute(
-        select(User)
-        .options(selectinload(User.roles))
-        .where(User.id == user_id)
+        select(User).options(noload(User.roles)).where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
 
@@ -668,16 +737,19 @@ async def add_role_to_user(
         raise HTTPException(status_code=404, detail="User not found")
 
     result = await db.execute(
-        select(Role).where(Role.id == role_id)
+        select(Role).options(noload(Role.permissions)).where(Role.id == role_id)
     )
     role = result.scalar_one_or_none()
 
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
 
-    if role not in user.roles:
-        user.roles.append(role)
-        await db.commit()
+    await db.execute(
+        pg_insert(user_roles)
+        .values(user_id=user_id, role_id=role_id)
+        .on_conflict_do_nothing()
+    )
+    await db.commit()
 
     return {"message": f"Role '{role.display_name}' assigned to user '{user.email}'"}
 
@@ -691,9 +763,7 @@ async def remove_role_from_user(
 ):
     """Remove a role from a user"""
     result = await db.execute(
-        select(User)
-        .options(selectinload(User.roles))
-        .where(User.id == user_id)
+        select(User).options(noload(User.roles)).where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
 
@@ -701,33 +771,48 @@ async def remove_role_from_user(
         raise HTTPException(status_code=404, detail="User not found")
 
     result = await db.execute(
-        select(Role).where(Role.id == role_id)
+        select(Role).options(noload(Role.permissions)).where(Role.id == role_id)
     )
     role = result.scalar_one_or_none()
 
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
 
-    if role in user.roles:
-        user.roles.remove(role)
-        await db.commit()
+    await db.execute(
+        delete(user_roles).where(
+            user_roles.c.user_id == user_id,
+            user_roles.c.role_id == role_id,
+        )
+    )
+    await db.commit()
 
     return {"message": f"Role '{role.display_name}' removed from user '{user.email}'"}
 
 
 # ============= Utility Endpoints =============
 
+async def _cached_distinct(db: AsyncSession, name: str, column) -> List[str]:
+    """Serve the tiny resource/action lists from an in-process TTL cache.
+
+    Permissions change rarely; mutations invalidate the cache explicitly.
+    """
+    cached = _resource_action_cache.get(name)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    result = await db.execute(select(column).distinct().order_by(column))
+    values = [row[0] for row in result.all()]
+    _resource_action_cache[name] = (values, time.monotonic() + _RESOURCE_ACTION_TTL)
+    return values
+
+
 @router.get("/resources")
 async def list_resources(
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get list of all unique resources from permissions"""
-    result = await db.execute(
-        select(Permission.resource).distinct().order_by(Permission.resource)
-    )
-    resources = [row[0] for row in result.all()]
-    return {"resources": resources}
+    return {"resources": await _cached_distinct(db, "resources", Permission.resource)}
 
 
 @router.get("/actions")
@@ -736,8 +821,4 @@ async def list_actions(
     db: AsyncSession = Depends(get_db)
 ):
     """Get list of all unique actions from permissions"""
-    result = await db.execute(
-        select(Permission.action).distinct().order_by(Permission.action)
-    )
-    actions = [row[0] for row in result.all()]
-    return {"actions": actions}
+    return {"actions": await _cached_distinct(db, "actions", Permission.action)}
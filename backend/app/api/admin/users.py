@@ -1,18 +1,20 @@
 from typing import List, Optional
 from uuid import UUID
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.orm import selectinload, raiseload, noload
 from datetime import datetime
 
 from app.database import get_db
 from app.api.auth import get_current_admin_user
 from app.models.user import User
-from app.models.rbac import Role
+from app.models.rbac import Role, user_roles
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class RoleInfo(BaseModel):
@@ -38,6 +40,9 @@ class UserResponse(BaseModel):
 
 
 class UserUpdateRequest(BaseModel):
+    # Rarely hit; defer the pydantic-core build to first use
+    model_config = ConfigDict(defer_build=True)
+
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     phone: Optional[str] = None
@@ -47,9 +52,25 @@ class UserUpdateRequest(BaseModel):
     # Use role assignment to grant/revoke admin access
 
 
-def user_to_response(user: User) -> UserResponse:
-    """Convert User model to response with roles."""
-    return UserResponse(
+def user_to_response(
+    user: User,
+    roles: Optional[List[RoleInfo]] = None,
+    is_admin: Optional[bool] = None,
+) -> UserResponse:
+    """Convert User model to response with roles.
+
+    Uses model_construct since ORM attributes are already typed. Callers
+    that fetched role data separately pass roles/is_admin so the loaded
+    relationship isn't touched.
+    """
+    if roles is None:
+        roles = [
+            RoleInfo.model_construct(
+                id=str(role.id), name=role.name, display_name=role.display_name
+            )
+            for role in (user.roles or [])
+        ]
+    return UserResponse.model_construct(
         id=str(user.id),
         email=user.email,
         first_name=user.first_name,
@@ -57,32 +78,82 @@ def user_to_response(user: User) -> UserResponse:
         phone=user.phone,
         company_name=user.company_name,
         is_active=user.is_active,
-        is_admin=user.is_admin,
-        roles=[
-            RoleInfo(id=str(role.id), name=role.name, display_name=role.display_name)
-            for role in (user.roles or [])
-        ],
+        is_admin=user.is_admin if is_admin is None else is_admin,
+        roles=roles,
         created_at=user.created_at,
     )
 
 
+def _decode_user_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Parse an opaque "<created_at isoformat>,<id>" keyset cursor."""
+    try:
+        ts_raw, _, id_raw = cursor.partition(",")
+        return datetime.fromisoformat(ts_raw), UUID(id_raw)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("", response_model=List[UserResponse])
 async def list_users(
     admin_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100
 ):
-    """List all users (admin only)"""
-    result = await db.execute(
+    """List users (admin only), newest first.
+
+    Uses keyset pagination: pass the last row's "<created_at>,<id>" as
+    cursor to fetch the next page. Unlike OFFSET, this stays O(log n)
+    however deep the client pages.
+    """
+    query = (
         select(User)
-        .options(selectinload(User.roles))
-        .order_by(User.created_at.desc())
-        .offset(skip)
+        .options(noload(User.roles), raiseload("*"))
+        .order_by(User.created_at.desc(), User.id.desc())
         .limit(limit)
     )
+    if cursor:
+        last_ts, last_id = _decode_user_cursor(cursor)
+        query = query.where(tuple_(User.created_at, User.id) < (last_ts, last_id))
+
+    result = await db.execute(query)
     users = result.scalars().all()
-    return [user_to_response(user) for user in users]
+
+    # RoleInfo only needs three columns, so fetch them with one narrow
+    # join instead of materializing full Role objects via selectin
+    roles_map: dict = {}
+    admin_ids: set = set()
+    if users:
+        rows = await db.execute(
+            select(user_roles.c.user_id, Role.id, Role.name, Role.display_name, Role.is_active)
+            .join(Role, Role.id == user_roles.c.role_id)
+            .where(user_roles.c.user_id.in_([u.id for u in users]))
+        )
+        for uid, role_id, name, display_name, role_active in rows:
+            roles_map.setdefault(uid, []).append(
+                RoleInfo.model_construct(
+                    id=str(role_id), name=name, display_name=display_name
+                )
+            )
+            if role_active and name in ("admin", "superadmin"):
+                admin_ids.add(uid)
+
+    # Stream the page row by row instead of materializing one large buffer
+    async def render():
+        yield b"["
+        for i, user in enumerate(users):
+            if i:
+                yield b","
+            yield orjson.dumps(
+                user_to_response(
+                    user,
+                    roles=roles_map.get(user.id, []),
+                    is_admin=user.is_superadmin or user.id in admin_ids,
+                ).model_dump()
+            )
+        yield b"]"
+
+    return StreamingResponse(render(), media_type="application/json")
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -94,7 +165,7 @@ async def get_user(
     """Get user details (admin only)"""
     result = await db.execute(
         select(User)
-        .options(selectinload(User.roles))
+        .options(selectinload(User.roles), raiseload("*"))
         .where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
@@ -117,30 +188,24 @@ async def update_user(
     if user_id == admin_user.id:
         raise HTTPException(status_code=403, detail="Cannot modify your own account")
 
+    # Note: is_admin is computed from roles, use role assignment instead
+    patch = request.model_dump(exclude_unset=True, exclude_none=True)
+    if not patch:
+        raise HTTPException(status_code=400, detail="No fields to update")
+
+    # Single UPDATE ... RETURNING instead of SELECT + mutate + refresh
     result = await db.execute(
-        select(User)
-        .options(selectinload(User.roles))
-        .where(User.id == user_id)
+        update(User).where(User.id == user_id).values(**patch).returning(User.id)
     )
-    user = result.scalar_one_or_none()
-
-    if not user:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Update fields if provided
-    if request.first_name is not None:
-        user.first_name = request.first_name
-    if request.last_name is not None:
-        user.last_name = request.last_name
-    if request.phone is not None:
-        user.phone = request.phone
-    if request.company_name is not None:
-        user.company_name = request.company_name
-    if request.is_active is not None:
-        user.is_active = request.is_active
-    # Note: is_admin is computed from roles, use role assignment instead
-
     await db.commit()
-    await db.refresh(user)
 
-    return user_to_response(user)
+    # Reload with roles for the response
+    result = await db.execute(
+        select(User)
+        .options(selectinload(User.roles), raiseload("*"))
+        .where(User.id == user_id)
+    )
+    return user_to_response(result.scalar_one())
@@ -1,29 +1,71 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import time
+import orjson
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+import jwt
 
 from app.database import get_db
 from app.config import settings
 from app.models.user import User
 from app.models.password_reset import PasswordResetToken
-from app.models.rbac import Role
+from app.models.rbac import Role, user_roles
 from app.tasks.email import send_password_reset_email
+from app.utils.passwords import ahash_password, averify_password, hash_password
 
 
 router = APIRouter()
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# HMAC key as bytes and algorithm tuple, computed once so each
+# encode/decode skips the per-call conversions and list allocation
+_SECRET_BYTES = settings.secret_key.encode()
+_JWT_ALGOS = (settings.jwt_algorithm,)
+
+# Verified against when the login email is unknown, so that branch costs
+# the same bcrypt work as a wrong password and can't be timed apart
+_DUMMY_HASH = hash_password("dummy-password-for-timing")
+
+# The only User columns the auth paths touch; everything else (audit
+# timestamps, email_verified) stays deferred instead of riding every SELECT
+_USER_COLUMNS = load_only(
+    User.id, User.email, User.password_hash, User.first_name, User.last_name,
+    User.phone, User.company_name, User.is_active, User.is_superadmin,
+    User.created_at,
+)
+
+# Full auth load: roles and their permissions arrive in the same batched
+# selectin pass, and raiseload makes any other lazy access fail fast
+# instead of silently turning into an N+1
+_USER_AUTH_OPTIONS = (
+    _USER_COLUMNS,
+    # joinedload keeps the whole role graph (1-3 roles x <=50
+    # permissions) in the roles SELECT instead of a third round trip;
+    # the outer join preserves roles with no permissions
+    selectinload(User.roles).joinedload(Role.permissions),
+    raiseload("*"),
+)
+
+# LRU of validated tokens: blake2b(token) -> (user_id, exp). A SPA replays
+# the same bearer token on every request, so after the first decode the
+# rest only pay a hash + dict lookup. Entries expire with the token.
+_TOKEN_CACHE: "OrderedDict[bytes, tuple[str, float]]" = OrderedDict()
+_TOKEN_CACHE_MAX = 10_000
+
 
 # Pydantic Schemas
 class UserCreate(BaseModel):
@@ -36,7 +78,7 @@ class UserCreate(BaseModel):
 
 
 class UserResponse(BaseModel):
-    id: str
+    id: UUID
     email: str
     first_name: str
     last_name: str
@@ -50,6 +92,11 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+# Validator built once at import; walks the ORM object in a single
+# C-implemented sweep instead of per-field Python constructor calls
+_USER_RESP = TypeAdapter(UserResponse)
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
@@ -94,23 +141,50 @@ class MessageResponse(BaseModel):
 
 
 # Helper functions
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+# Signing through the JWS layer lets us hand it an orjson-serialized
+# payload instead of PyJWT's stdlib-json claim encoding
+_jws = jwt.PyJWS()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
+    # exp is a plain unix timestamp; no need to round-trip through datetime
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        to_encode["exp"] = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
-    return encoded_jwt
+        to_encode["exp"] = int(time.time()) + settings.jwt_expire_minutes * 60
+    return _jws.encode(
+        orjson.dumps(to_encode), _SECRET_BYTES, algorithm=settings.jwt_algorithm
+    )
+
+
+# Header segment of every token we issue, taken from a real encode so it
+# matches the library's exact serialization
+_FAST_HEADER = create_access_token({}).split(".", 1)[0].encode() + b"."
+
+
+def _decode_token(token: str) -> dict:
+    """Decode and verify a bearer token.
+
+    Tokens minted here always start with the same fixed header, so the
+    common case verifies the HMAC directly and orjson-parses the payload
+    without the library's header JSON parse. Anything unexpected falls
+    back to jwt.decode, which also produces the proper error.
+    """
+    raw = token.encode()
+    if raw.startswith(_FAST_HEADER):
+        try:
+            signing_input, _, sig = raw.rpartition(b".")
+            digest = hmac.new(_SECRET_BYTES, signing_input, hashlib.sha256).digest()
+            if hmac.compare_digest(digest, base64.urlsafe_b64decode(sig + b"=" * (-len(sig) % 4))):
+                payload_seg = signing_input[len(_FAST_HEADER):]
+                payload = orjson.loads(base64.urlsafe_b64decode(payload_seg + b"=" * (-len(payload_seg) % 4)))
+                if payload.get("exp", 0) < time.time():
+                    raise jwt.ExpiredSignatureError("Signature has expired")
+                return payload
+        except (ValueError, orjson.JSONDecodeError):
+            pass
+    return jwt.decode(raw, _SECRET_BYTES, algorithms=_JWT_ALGOS)
 
 
 async def get_current_user(
@@ -122,17 +196,28 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
-        user_id: str = payload.get("sub")
-        if user_id is None:
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    entry = _TOKEN_CACHE.get(digest)
+    if entry is not None and time.time() < entry[1] - 5:
+        _TOKEN_CACHE.move_to_end(digest)
+        user_id = entry[0]
+    else:
+        _TOKEN_CACHE.pop(digest, None)
+        try:
+            payload = _decode_token(token)
+            user_id = payload.get("sub")
+            if user_id is None:
+                raise credentials_exception
+        except jwt.PyJWTError:
             raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    
+        _TOKEN_CACHE[digest] = (user_id, float(payload["exp"]))
+        if len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+            _TOKEN_CACHE.popitem(last=False)
+
+    # PK lookup goes through the identity map, so a user already loaded
+    # in this session costs no extra round-trip
+    user = await db.get(User, user_id, options=_USER_AUTH_OPTIONS)
+
     if user is None:
         raise credentials_exception
     if not user.is_active:
@@ -141,60 +226,107 @@ async def get_current_user(
 
 
 async def get_current_admin_user(
-    current_user: User = Depends(get_current_user)
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
 ) -> User:
-    if not current_user.is_admin:
+    """Admin gate driven by signed JWT claims plus a liveness probe.
+
+    Admin status is embedded in the token at login, so admin endpoints
+    don't pay a user+roles load just to check access. Because tokens
+    live for jwt_expire_minutes (24h by default), the claim alone would
+    let a deactivated or deleted admin keep access until expiry — so one
+    indexed PK probe confirms the account is still active before
+    trusting it. Returns a detached stub carrying only id/email.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        payload = _decode_token(token)
+        user_id: str = payload.get("sub")
+        if user_id is None:
+            raise credentials_exception
+    except jwt.PyJWTError:
+        raise credentials_exception
+
+    if not payload.get("is_admin"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
-    return current_user
+
+    is_active = await db.scalar(
+        select(User.is_active).where(User.id == UUID(user_id))
+    )
+    if is_active is None:
+        raise credentials_exception
+    if not is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+
+    return User(id=UUID(user_id), email=payload.get("email"))
 
 
 # Routes
 @router.post("/signup", response_model=Token)
 async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """Register a new user"""
-    # Check if email already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    if result.scalar_one_or_none():
+    # Get default "user" role first
+    result = await db.execute(select(Role.id).where(Role.name == "user"))
+    default_role_id = result.scalar_one_or_none()
+
+    # Duplicate check and insert in one statement; RETURNING also makes
+    # the commit/refresh pair unnecessary
+    stmt = (
+        pg_insert(User)
+        .values(
+            email=user_data.email,
+            password_hash=await ahash_password(user_data.password),
+            first_name=user_data.first_name,
+            last_name=user_data.last_name,
+            phone=user_data.phone,
+            company_name=user_data.company_name,
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User)
+    )
+    result = await db.execute(stmt)
+    user = result.scalar_one_or_none()
+
+    if user is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    
-    # Get default "user" role first
-    result = await db.execute(select(Role).where(Role.name == "user"))
-    default_role = result.scalar_one_or_none()
-
-    # Create user with default role
-    user = User(
-        email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
-        first_name=user_data.first_name,
-        last_name=user_data.last_name,
-        phone=user_data.phone,
-        company_name=user_data.company_name,
-        roles=[default_role] if default_role else [],
-    )
-    db.add(user)
+
+    if default_role_id is not None:
+        await db.execute(
+            pg_insert(user_roles)
+            .values(user_id=user.id, role_id=default_role_id)
+            .on_conflict_do_nothing()
+        )
     await db.commit()
-    await db.refresh(user)
 
-    # Generate token
-    access_token = create_access_token(data={"sub": str(user.id)})
+    # Generate token (admin claim lets admin endpoints skip the DB check);
+    # a fresh signup only ever holds the default role, so never admin
+    access_token = create_access_token(
+        data={"sub": str(user.id), "email": user.email, "is_admin": False}
+    )
 
+    # Built field-by-field since the RETURNING row has no roles loaded
     return Token(
         access_token=access_token,
-        user=UserResponse(
-            id=str(user.id),
+        user=UserResponse.model_construct(
+            id=user.id,
             email=user.email,
             first_name=user.first_name,
             last_name=user.last_name,
             phone=user.phone,
             company_name=user.company_name,
             is_active=user.is_active,
-            is_admin=user.is_admin,
+            is_admin=False,
             created_at=user.created_at,
         )
     )
@@ -206,10 +338,16 @@ async def login(
     db: AsyncSession = Depends(get_db)
 ):
     """Login with email and password"""
-    result = await db.execute(select(User).where(User.email == form_data.username))
+    result = await db.execute(
+        select(User).options(_USER_COLUMNS).where(User.email == form_data.username)
+    )
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(form_data.password, user.password_hash):
+    # Always run the verify, against a dummy hash if the email is unknown
+    password_ok = await averify_password(
+        form_data.password, user.password_hash if user else _DUMMY_HASH
+    )
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -221,39 +359,32 @@ async def login(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    
-    access_token = create_access_token(data={"sub": str(user.id)})
-    
+
+    # Opportunistic rehash: if the stored hash's embedded cost no longer
+    # matches bcrypt_rounds, upgrade it now while we hold the plaintext,
+    # so cost changes roll out without a mass password reset
+    try:
+        stored_rounds = int(user.password_hash[4:6])
+    except ValueError:
+        stored_rounds = None
+    if stored_rounds != settings.bcrypt_rounds:
+        user.password_hash = await ahash_password(form_data.password)
+        await db.commit()
+
+    access_token = create_access_token(
+        data={"sub": str(user.id), "email": user.email, "is_admin": user.is_admin}
+    )
+
     return Token(
         access_token=access_token,
-        user=UserResponse(
-            id=str(user.id),
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            phone=user.phone,
-            company_name=user.company_name,
-            is_active=user.is_active,
-            is_admin=user.is_admin,
-            created_at=user.created_at,
-        )
+        user=_USER_RESP.validate_python(user, from_attributes=True),
     )
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information"""
-    return UserResponse(
-        id=str(current_user.id),
-        email=current_user.email,
-        first_name=current_user.first_name,
-        last_name=current_user.last_name,
-        phone=current_user.phone,
-        company_name=current_user.company_name,
-        is_active=current_user.is_active,
-        is_admin=current_user.is_admin,
-        created_at=current_user.created_at,
-    )
+    return _USER_RESP.validate_python(current_user, from_attributes=True)
 
 
 @router.post("/forgot-password", response_model=ForgotPasswordResponse)
@@ -262,9 +393,11 @@ async def forgot_password(
     db: AsyncSession = Depends(get_db)
 ):
     """Request a password reset email"""
-    # Find user by email
-    result = await db.execute(select(User).where(User.email == request.email))
-    user = result.scalar_one_or_none()
+    # Find user by email; only the three columns this path reads
+    result = await db.execute(
+        select(User.id, User.email, User.first_name).where(User.email == request.email)
+    )
+    user = result.one_or_none()
 
     # Always return success to prevent email enumeration
     if not user:
@@ -272,14 +405,15 @@ async def forgot_password(
             message="If an account exists with this email, you will receive a password reset link."
         )
 
-    # Invalidate any existing tokens for this user
+    # Invalidate any existing tokens for this user in one bulk UPDATE
     await db.execute(
-        select(PasswordResetToken)
+        update(PasswordResetToken)
         .where(PasswordResetToken.user_id == user.id, PasswordResetToken.used == False)
+        .values(used=True, used_at=datetime.utcnow())
     )
 
-    # Generate new reset token
-    reset_token = PasswordResetToken.generate_token(user.id)
+    # Generate new reset token; only the plaintext goes to the email
+    reset_token, plaintext_token = PasswordResetToken.generate_token(user.id)
     db.add(reset_token)
     await db.commit()
 
@@ -287,7 +421,7 @@ async def forgot_password(
     send_password_reset_email.delay(
         to_email=user.email,
         username=user.first_name,
-        reset_token=reset_token.token
+        reset_token=plaintext_token
     )
 
     return ForgotPasswordResponse(
@@ -301,9 +435,15 @@ async def reset_password(
     db: AsyncSession = Depends(get_db)
 ):
     """Reset password using a valid token"""
-    # Find the token
+    # Validity is part of the query, so used/expired rows never leave
+    # the database and the lookup rides the partial index on active
+    # tokens
     result = await db.execute(
-        select(PasswordResetToken).where(PasswordResetToken.token == request.token)
+        select(PasswordResetToken).where(
+            PasswordResetToken.token_hash == PasswordResetToken.hash_token(request.token),
+            PasswordResetToken.used.is_(False),
+            PasswordResetToken.expires_at > datetime.utcnow(),
+        )
     )
     reset_token = result.scalar_one_or_none()
 
@@ -313,15 +453,8 @@ async def reset_password(
             detail="Invalid or expired reset token"
         )
 
-    if not reset_token.is_valid:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or expired reset token"
-        )
-
-    # Get the user
-    result = await db.execute(select(User).where(User.id == reset_token.user_id))
-    user = result.scalar_one_or_none()
+    # Get the user (PK lookup rides the identity map)
+    user = await db.get(User, reset_token.user_id)
 
     if not user:
         raise HTTPException(
@@ -329,9 +462,8 @@ async def reset_password(
             detail="Invalid or expired reset token"
         )
 
-    # Update password
-    user.password_hash = get_password_hash(request.new_password)
-    user.updated_at = datetime.utcnow()
+    # Update password (updated_at is filled server-side on UPDATE)
+    user.password_hash = await ahash_password(request.new_password)
 
     # Mark token as used
     reset_token.used = True
@@ -358,21 +490,10 @@ async def update_profile(
     if request.company_name is not None:
         current_user.company_name = request.company_name
 
-    current_user.updated_at = datetime.utcnow()
     await db.commit()
     await db.refresh(current_user)
 
-    return UserResponse(
-        id=str(current_user.id),
-        email=current_user.email,
-        first_name=current_user.first_name,
-        last_name=current_user.last_name,
-        phone=current_user.phone,
-        company_name=current_user.company_name,
-        is_active=current_user.is_active,
-        is_admin=current_user.is_admin,
-        created_at=current_user.created_at,
-    )
+    return _USER_RESP.validate_python(current_user, from_attributes=True)
 
 
 @router.post("/change-password", response_model=MessageResponse)
@@ -383,7 +504,7 @@ async def change_password(
 ):
     """Change current user's password"""
     # Verify current password
-    if not verify_password(request.current_password, current_user.password_hash):
+    if not await averify_password(request.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
@@ -397,8 +518,7 @@ async def change_password(
         )
 
     # Update password
-    current_user.password_hash = get_password_hash(request.new_password)
-    current_user.updated_at = datetime.utcnow()
+    current_user.password_hash = await ahash_password(request.new_password)
     await db.commit()
 
     return MessageResponse(message="Password changed successfully")
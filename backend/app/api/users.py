@@ -1,17 +1,16 @@
 from typing import Optional
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from passlib.context import CryptContext
 
 from app.database import get_db
 from app.api.auth import get_current_user
+from app.utils.passwords import ahash_password, averify_password
 from app.models.user import User
 
 router = APIRouter()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class ProfileUpdate(BaseModel):
     first_name: Optional[str] = None
@@ -26,7 +25,9 @@ class PasswordChange(BaseModel):
 
 
 class ProfileResponse(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
     email: str
     first_name: str
     last_name: str
@@ -34,17 +35,14 @@ class ProfileResponse(BaseModel):
     company_name: Optional[str]
 
 
+# Built once at import; validates the ORM object in a single sweep
+_PROFILE_RESP = TypeAdapter(ProfileResponse)
+
+
 @router.get("/profile", response_model=ProfileResponse)
 async def get_profile(current_user: User = Depends(get_current_user)):
     """Get current user's profile"""
-    return ProfileResponse(
-        id=str(current_user.id),
-        email=current_user.email,
-        first_name=current_user.first_name,
-        last_name=current_user.last_name,
-        phone=current_user.phone,
-        company_name=current_user.company_name,
-    )
+    return _PROFILE_RESP.validate_python(current_user)
 
 
 @router.patch("/profile", response_model=ProfileResponse)
@@ -66,14 +64,7 @@ async def update_profile(
     await db.commit()
     await db.refresh(current_user)
 
-    return ProfileResponse(
-        id=str(current_user.id),
-        email=current_user.email,
-        first_name=current_user.first_name,
-        last_name=current_user.last_name,
-        phone=current_user.phone,
-        company_name=current_user.company_name,
-    )
+    return _PROFILE_RESP.validate_python(current_user)
 
 
 @router.post("/change-password")
@@ -84,7 +75,7 @@ async def change_password(
 ):
     """Change current user's password"""
     # Verify current password
-    if not pwd_context.verify(password_data.current_password, current_user.password_hash):
+    if not await averify_password(password_data.current_password, current_user.password_hash):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
 
     # Validate new password
@@ -92,7 +83,7 @@ async def change_password(
         raise HTTPException(status_code=400, detail="New password must be at least 8 characters")
 
     # Update password
-    current_user.password_hash = pwd_context.hash(password_data.new_password)
+    current_user.password_hash = await ahash_password(password_data.new_password)
     await db.commit()
 
     return {"success": True, "message": "Password changed successfully"}
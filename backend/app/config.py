@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 
@@ -34,6 +34,11 @@ class Settings(BaseSettings):
     database_port: int | None = None  # None = use default for dialect
     database_name: str = "sampleapp"  # For SQLite: file path (e.g., ./data.db)
 
+    # Connection pool (ignored for SQLite)
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+
     @property
     def database_url(self) -> str:
         """Build async database URL for SQLAlchemy."""
@@ -56,6 +61,7 @@ class Settings(BaseSettings):
     secret_key: str = "your-super-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 1440  # 24 hours
+    bcrypt_rounds: int = 12  # KDF cost factor (~250ms per hash at 12)
 
     # Email/SMTP Settings
     smtp_host: str = "smtp.gmail.com"
@@ -89,9 +95,11 @@ class Settings(BaseSettings):
     # Password Reset
     password_reset_expire_minutes: int = 30
     
-    @property
-    def cors_origins_list(self) -> list[str]:
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        # Split once; config never changes after startup. Tuple so nothing
+        # can mutate the shared value.
+        return tuple(origin.strip() for origin in self.cors_origins.split(","))
     
     model_config = ConfigDict(
         extra="ignore",
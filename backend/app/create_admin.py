@@ -15,14 +15,12 @@ Usage:
 import argparse
 import asyncio
 import getpass
-from passlib.context import CryptContext
-from sqlalchemy import select
 
-from app.database import AsyncSessionLocal
-from app.models.user import User
-from app.models.rbac import Role
+import asyncpg
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.config import settings
+from app.utils.ids import uuid7
+from app.utils.passwords import hash_password
 
 
 async def create_admin(
@@ -31,63 +29,84 @@ async def create_admin(
     first_name: str,
     last_name: str
 ):
-    """Create a new super admin user with superadmin role."""
-    async with AsyncSessionLocal() as db:
-        # Check if user already exists
-        result = await db.execute(select(User).where(User.email == email))
-        existing = result.scalar_one_or_none()
+    """Create a new super admin user with superadmin role.
+
+    Talks to Postgres through asyncpg directly: a one-shot CLI paying
+    SQLAlchemy engine/mapper bootstrap for two statements spends far
+    longer importing than querying.
+    """
+    # Hash on a worker thread while the connection is being established;
+    # wall clock becomes max(bcrypt, connect) instead of their sum
+    connect_task = asyncio.create_task(
+        asyncpg.connect(
+            settings.database_url.replace("postgresql+asyncpg://", "postgresql://")
+        )
+    )
+    hash_task = asyncio.create_task(asyncio.to_thread(hash_password, password))
+
+    conn = await connect_task
+    try:
+        existing = await conn.fetchrow(
+            "SELECT id, is_superadmin FROM users WHERE email = $1", email
+        )
+        role_id = await conn.fetchval(
+            "SELECT id FROM roles WHERE name = 'superadmin'"
+        )
 
         if existing:
             print(f"Error: User with email '{email}' already exists.")
-            if existing.is_superadmin:
+            if existing["is_superadmin"]:
                 print("This user is already a super admin.")
             else:
                 print("Promoting user to super admin...")
-                existing.is_superadmin = True
-                # Get and assign superadmin role
-                result = await db.execute(select(Role).where(Role.name == "superadmin"))
-                superadmin_role = result.scalar_one_or_none()
-                if superadmin_role and superadmin_role not in existing.roles:
-                    existing.roles.append(superadmin_role)
-                await db.commit()
+                await conn.execute(
+                    "UPDATE users SET is_superadmin = TRUE WHERE id = $1",
+                    existing["id"],
+                )
+                if role_id:
+                    await conn.execute(
+                        "INSERT INTO user_roles (user_id, role_id) "
+                        "VALUES ($1, $2) ON CONFLICT DO NOTHING",
+                        existing["id"], role_id,
+                    )
                 print(f"User '{email}' is now a super admin.")
+            # Promotion doesn't need the hash; let the thread finish
+            await hash_task
             return
 
-        # Get superadmin role
-        result = await db.execute(select(Role).where(Role.name == "superadmin"))
-        superadmin_role = result.scalar_one_or_none()
-
         # Create new super admin user
-        user = User(
-            email=email,
-            password_hash=pwd_context.hash(password),
-            first_name=first_name,
-            last_name=last_name,
-            is_superadmin=True,
-            is_active=True,
-            email_verified=True,
-            roles=[superadmin_role] if superadmin_role else [],
+        user_id = uuid7()
+        await conn.execute(
+            "INSERT INTO users "
+            "(id, email, password_hash, first_name, last_name, "
+            " is_superadmin, is_active, email_verified) "
+            "VALUES ($1, $2, $3, $4, $5, TRUE, TRUE, TRUE)",
+            user_id, email, await hash_task, first_name, last_name,
         )
-        db.add(user)
-        await db.commit()
+        if role_id:
+            await conn.execute(
+                "INSERT INTO user_roles (user_id, role_id) "
+                "VALUES ($1, $2) ON CONFLICT DO NOTHING",
+                user_id, role_id,
+            )
         print(f"Super admin user created: {email}")
+    finally:
+        await conn.close()
 
 
-def get_input(prompt: str, default: str = None, required: bool = True) -> str:
+def get_input(label: str, default: str = None, required: bool = True) -> str:
     """Get user input with optional default value."""
-    if default:
-        prompt = f"{prompt} [{default}]: "
-    else:
-        prompt = f"{prompt}: "
-
-    value = input(prompt).strip()
-
-    if not value and default:
-        return default
-    if not value and required:
+    prompt = f"{label} [{default}]: " if default else f"{label}: "
+
+    while True:
+        value = input(prompt).strip()
+        if value:
+            return value
+        if default:
+            return default
+        if not required:
+            return ""
         print("This field is required.")
-        return get_input(prompt.replace(": ", "").replace(f" [{default}]", ""), default, required)
-    return value
 
 
 def parse_args():
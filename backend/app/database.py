@@ -1,14 +1,38 @@
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
 from app.config import settings
 
+# Server-side naive-UTC timestamp for created_at/updated_at defaults.
+# The models store naive UTC (datetime.utcnow convention), so a bare
+# now() would leak the server timezone; timezone('utc', now()) keeps
+# the stored value comparable with utcnow() while letting Postgres fill
+# the column instead of binding a Python-allocated datetime per row.
+UTC_NOW = text("timezone('utc', now())")
+
 # Database URL is already configured with async driver prefix
-engine = create_async_engine(
-    settings.database_url,
-    echo=False,  # disable SQL echo to avoid exposing raw SQL in logs
-    future=True,
-)
+_engine_kwargs: dict = {
+    "echo": False,  # disable SQL echo to avoid exposing raw SQL in logs
+    "future": True,
+    # Room for every hot statement shape; the default 500 can thrash once
+    # the admin/RBAC endpoints are in play
+    "query_cache_size": 1200,
+}
+
+# The default pool of 5 queues requests under concurrent auth load; size
+# it for the workload and recycle/ping so stale connections don't 500.
+# SQLite has no server-side pool to tune, so leave its defaults alone.
+if settings.database_dialect != "sqlite":
+    _engine_kwargs.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+
+engine = create_async_engine(settings.database_url, **_engine_kwargs)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -1,7 +1,12 @@
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import settings
@@ -9,7 +14,8 @@ from app.database import engine, Base, AsyncSessionLocal
 from app.api import auth, users
 from app.api.admin import admin_router
 from app.startup import run_startup_tasks
-from app.utils.logger import logger
+from app.utils.logger import AppLogger, logger
+from app.utils.passwords import warmup as warmup_bcrypt
 
 # Reduce noise from third-party libraries
 logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -22,6 +28,13 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.app_name} in {settings.environment} mode")
     logger.info(f"Debug: {settings.debug}, Log Level: {settings.log_level}")
 
+    # Size the executor that absorbs offloaded CPU work (bcrypt hashing)
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2))
+
+    # Warm the bcrypt backend before the server accepts connections
+    warmup_bcrypt()
+
     # Tables are created via migrations (alembic upgrade head)
     # Don't auto-create tables here
 
@@ -34,6 +47,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application")
     await engine.dispose()
+    AppLogger.shutdown()
 
 
 app = FastAPI(
@@ -42,6 +56,7 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -53,6 +68,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses; small payloads aren't worth the CPU, so only
+# bodies over 500 bytes. Registered after CORS so its headers survive.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/api/users", tags=["Users"])
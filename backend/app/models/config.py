@@ -1,16 +1,19 @@
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Text, Boolean, DateTime
+import json
+from types import MappingProxyType
+from typing import Any, Mapping
+from sqlalchemy import Column, String, Text, Boolean, DateTime, and_, case, event, literal
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import column_property
 
-from app.database import Base
+from app.database import Base, UTC_NOW
+from app.utils.ids import uuid7
 
 
 class AppConfig(Base):
     """Database-driven application configuration."""
     __tablename__ = "app_config"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     key = Column(String(100), unique=True, nullable=False, index=True)
     value = Column(Text, nullable=True)
     description = Column(String(500), nullable=True)
@@ -18,30 +21,50 @@ class AppConfig(Base):
     category = Column(String(50), default="general")  # general, email, security, etc.
     is_secret = Column(Boolean, default=False)  # If true, value should be masked in UI
     is_editable = Column(Boolean, default=True)  # If false, cannot be edited via API
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
+
+    # Value with secret masking applied server-side, so response paths don't
+    # re-evaluate the masking branch per row in Python
+    display_value = column_property(
+        case(
+            (and_(is_secret.is_(True), value.isnot(None)), literal("********")),
+            else_=value,
+        )
+    )
 
     def get_typed_value(self):
-        """Return the value converted to its proper type."""
-        if self.value is None:
-            return None
+        """Return the value converted to its proper type.
 
-        if self.value_type == "int":
-            return int(self.value)
+        Parsed once per instance; hot keys read on every request pay a
+        dict lookup instead of re-parsing (json.loads for JSON values).
+        The event hooks below drop the cache whenever value/value_type
+        change, including through set_typed_value.
+        """
+        try:
+            return self.__dict__["_typed_value"]
+        except KeyError:
+            pass
+
+        if self.value is None:
+            typed = None
+        elif self.value_type == "int":
+            typed = int(self.value)
         elif self.value_type == "bool":
-            return self.value.lower() in ("true", "1", "yes")
+            typed = self.value.lower() in ("true", "1", "yes")
         elif self.value_type == "json":
-            import json
-            return json.loads(self.value)
+            typed = json.loads(self.value)
         else:
-            return self.value
+            typed = self.value
+
+        self.__dict__["_typed_value"] = typed
+        return typed
 
     def set_typed_value(self, value):
         """Set the value, converting from typed value to string."""
         if value is None:
             self.value = None
         elif self.value_type == "json":
-            import json
             self.value = json.dumps(value)
         elif self.value_type == "bool":
             self.value = "true" if value else "false"
@@ -49,8 +72,16 @@ class AppConfig(Base):
             self.value = str(value)
 
 
-# Default configuration values to seed
-DEFAULT_CONFIG = [
+@event.listens_for(AppConfig.value, "set")
+@event.listens_for(AppConfig.value_type, "set")
+def _invalidate_typed_value(target, value, oldvalue, initiator):
+    target.__dict__.pop("_typed_value", None)
+
+
+# Default configuration values to seed.
+# Frozen at import time (tuple of read-only mappings) so callers can iterate
+# without defensive copies and entries cannot be mutated accidentally.
+DEFAULT_CONFIG: tuple[Mapping[str, Any], ...] = tuple(MappingProxyType(d) for d in [
     # General
     {"key": "app_name", "value": "SampleApp", "description": "Application name", "category": "general", "value_type": "string"},
     {"key": "app_url", "value": "http://localhost:3000", "description": "Frontend application URL", "category": "general", "value_type": "string"},
@@ -77,4 +108,4 @@ DEFAULT_CONFIG = [
     # Features
     {"key": "maintenance_mode", "value": "false", "description": "Enable maintenance mode", "category": "features", "value_type": "bool"},
     {"key": "maintenance_message", "value": "We are currently performing maintenance. Please check back later.", "description": "Maintenance mode message", "category": "features", "value_type": "string"},
-]
+])
@@ -1,35 +1,45 @@
+import hashlib
 import uuid
 import secrets
 from datetime import datetime, timedelta
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, DateTime, Boolean, ForeignKey, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID
 
-from app.database import Base
+from app.database import Base, UTC_NOW
 from app.config import settings
+from app.utils.ids import uuid7
 
 
 class PasswordResetToken(Base):
     """Store password reset tokens for users."""
     __tablename__ = "password_reset_tokens"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    token = Column(String(255), unique=True, nullable=False, index=True)
+    # SHA-256 of the token; the plaintext only ever exists in the reset
+    # email. A 32-byte BYTEA key halves the index leaf width vs the old
+    # varchar(255) and a DB leak exposes no usable tokens.
+    token_hash = Column(LargeBinary(32), unique=True, nullable=False, index=True)
     expires_at = Column(DateTime, nullable=False)
     used = Column(Boolean, default=False)
     used_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        """Digest a plaintext token for storage or lookup."""
+        return hashlib.sha256(token.encode()).digest()
 
     @classmethod
-    def generate_token(cls, user_id: uuid.UUID) -> "PasswordResetToken":
-        """Generate a new password reset token for a user."""
+    def generate_token(cls, user_id: uuid.UUID) -> tuple["PasswordResetToken", str]:
+        """Generate a reset token; returns (row, plaintext-for-email)."""
         token = secrets.token_urlsafe(32)
         expires_at = datetime.utcnow() + timedelta(minutes=settings.password_reset_expire_minutes)
         return cls(
             user_id=user_id,
-            token=token,
+            token_hash=cls.hash_token(token),
             expires_at=expires_at
-        )
+        ), token
 
     @property
     def is_expired(self) -> bool:
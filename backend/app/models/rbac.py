@@ -1,12 +1,11 @@
 """RBAC (Role-Based Access Control) models for granular permission management"""
 
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, UniqueConstraint, Table, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, Text, UniqueConstraint, Table, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.database import Base
+from app.database import Base, UTC_NOW
+from app.utils.ids import uuid7
 
 
 # Association table for Role-Permission many-to-many
@@ -15,7 +14,7 @@ role_permissions = Table(
     Base.metadata,
     Column('role_id', UUID(as_uuid=True), ForeignKey('roles.id', ondelete='CASCADE'), primary_key=True),
     Column('permission_id', UUID(as_uuid=True), ForeignKey('permissions.id', ondelete='CASCADE'), primary_key=True),
-    Column('created_at', DateTime, default=datetime.utcnow),
+    Column('created_at', DateTime, server_default=UTC_NOW),
 )
 
 # Association table for User-Role many-to-many
@@ -24,10 +23,17 @@ user_roles = Table(
     Base.metadata,
     Column('user_id', UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
     Column('role_id', UUID(as_uuid=True), ForeignKey('roles.id', ondelete='CASCADE'), primary_key=True),
-    Column('assigned_at', DateTime, default=datetime.utcnow),
+    Column('assigned_at', DateTime, server_default=UTC_NOW),
     Column('assigned_by', UUID(as_uuid=True), ForeignKey('users.id'), nullable=True),
 )
 
+# The composite PKs lead with user_id/role_id, so forward lookups
+# ("roles for this user") reuse the PK btree via its left prefix. The
+# reverse direction ("users of this role", "roles holding this
+# permission") needs its own index
+Index('ix_user_roles_role_id', user_roles.c.role_id)
+Index('ix_role_permissions_permission_id', role_permissions.c.permission_id)
+
 
 class Permission(Base):
     """
@@ -36,7 +42,7 @@ class Permission(Base):
     """
     __tablename__ = "permissions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(100), unique=True, nullable=False)  # e.g., 'users:read'
     display_name = Column(String(150), nullable=False)  # e.g., 'View Users'
     description = Column(Text, nullable=True)
@@ -46,8 +52,8 @@ class Permission(Base):
     action = Column(String(50), nullable=False)  # e.g., 'read', 'create', 'update', 'delete', 'manage'
 
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # Relationships
     roles = relationship("Role", secondary=role_permissions, back_populates="permissions")
@@ -64,7 +70,7 @@ class Role(Base):
     """
     __tablename__ = "roles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(50), unique=True, nullable=False)  # e.g., 'admin', 'support', 'billing_manager'
     display_name = Column(String(100), nullable=False)  # e.g., 'Administrator', 'Support Staff'
     description = Column(Text, nullable=True)
@@ -76,11 +82,13 @@ class Role(Base):
     priority = Column(Integer, default=0)
 
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # Relationships
-    permissions = relationship("Permission", secondary=role_permissions, back_populates="roles", lazy="selectin")
+    # lazy="raise" forces callers to opt in (selectinload/joinedload);
+    # an implicit per-role SELECT can't sneak into a hot path unnoticed
+    permissions = relationship("Permission", secondary=role_permissions, back_populates="roles", lazy="raise")
     users = relationship(
         "User",
         secondary=user_roles,
@@ -1,16 +1,18 @@
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime
+from functools import cached_property
+from sqlalchemy import Column, String, Boolean, DateTime, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.database import Base
+from app.database import Base, UTC_NOW
+from app.utils.ids import uuid7
+
+_ADMIN_ROLES = frozenset(("admin", "superadmin"))
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     first_name = Column(String(100), nullable=False)
@@ -21,8 +23,8 @@ class User(Base):
     email_verified = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
     is_superadmin = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
 
     # RBAC - User can have multiple roles
     roles = relationship(
@@ -38,39 +40,68 @@ class User(Base):
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
+    @cached_property
+    def _active_role_names(self) -> frozenset:
+        """Active role names, computed once per instance (see the
+        permission cache below for the invalidation story)."""
+        return frozenset(role.name for role in self.roles if role.is_active)
+
     def has_role(self, role_name: str) -> bool:
         """Check if user has a specific role"""
-        if self.is_superadmin:
-            return True
-        return any(role.name == role_name and role.is_active for role in self.roles)
+        return self.is_superadmin or role_name in self._active_role_names
+
+    @cached_property
+    def _permission_names(self) -> frozenset:
+        """Flattened active permission names, computed once per instance.
+
+        Checking several permissions on one request then costs a hash
+        lookup each instead of re-walking roles x permissions. The event
+        hooks below drop the cache when the roles collection changes.
+        """
+        return frozenset(
+            permission.name
+            for role in self.roles if role.is_active
+            for permission in role.permissions if permission.is_active
+        )
 
     def has_permission(self, permission_name: str) -> bool:
         """Check if user has a specific permission through any of their roles"""
         if self.is_superadmin:
             return True
-        for role in self.roles:
-            if not role.is_active:
-                continue
-            for permission in role.permissions:
-                if permission.name == permission_name and permission.is_active:
-                    return True
-        return False
+        return permission_name in self._permission_names
+
+    def has_any_permission(self, *permission_names: str) -> bool:
+        """Check if user has at least one of the given permissions"""
+        if self.is_superadmin:
+            return True
+        return not self._permission_names.isdisjoint(permission_names)
+
+    def has_all_permissions(self, *permission_names: str) -> bool:
+        """Check if user has every one of the given permissions"""
+        if self.is_superadmin:
+            return True
+        return self._permission_names.issuperset(permission_names)
 
     def get_permissions(self) -> set:
         """Get all permission names this user has"""
         if self.is_superadmin:
             return {"*"}
-        permissions = set()
-        for role in self.roles:
-            if role.is_active:
-                for permission in role.permissions:
-                    if permission.is_active:
-                        permissions.add(permission.name)
-        return permissions
+        return set(self._permission_names)
 
     @property
     def is_admin(self) -> bool:
         """Check if user has admin access (superadmin or admin role)"""
-        if self.is_superadmin:
-            return True
-        return any(role.name in ("admin", "superadmin") and role.is_active for role in self.roles)
+        return self.is_superadmin or not self._active_role_names.isdisjoint(_ADMIN_ROLES)
+
+
+@event.listens_for(User.roles, "append")
+@event.listens_for(User.roles, "remove")
+def _invalidate_permission_cache(target, value, initiator):
+    target.__dict__.pop("_permission_names", None)
+    target.__dict__.pop("_active_role_names", None)
+
+
+@event.listens_for(User.roles, "bulk_replace")
+def _invalidate_permission_cache_bulk(target, values, initiator):
+    target.__dict__.pop("_permission_names", None)
+    target.__dict__.pop("_active_role_names", None)
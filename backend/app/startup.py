@@ -2,19 +2,27 @@
 Startup initialization: auto-seeds RBAC permissions, roles, and superadmin.
 Called automatically on first application startup.
 """
+import asyncio
 import logging
-from passlib.context import CryptContext
-from sqlalchemy import select, text
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.database import AsyncSessionLocal
 from app.models.user import User
-from app.models.rbac import Role, Permission
+from app.models.rbac import Role, Permission, role_permissions, user_roles
 from app.models.config import AppConfig, DEFAULT_CONFIG
 from app.config import settings
+from app.utils.passwords import hash_password
 
 logger = logging.getLogger(__name__)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Bump whenever DEFAULT_PERMISSIONS / DEFAULT_ROLES / DEFAULT_CONFIG
+# change so already-seeded databases run the pipeline once more
+SEED_VERSION = 1
 
 
 async def check_migrations_applied(db: AsyncSession) -> bool:
@@ -28,8 +36,10 @@ async def check_migrations_applied(db: AsyncSession) -> bool:
         return False
 
 
-# Default permissions for SampleApp
-DEFAULT_PERMISSIONS = [
+# Default permissions for SampleApp.
+# Frozen like DEFAULT_CONFIG: tuple of read-only mappings, so seeders can
+# iterate without defensive copies and nothing mutates them at runtime.
+DEFAULT_PERMISSIONS: tuple[Mapping[str, Any], ...] = tuple(MappingProxyType(d) for d in [
     # Users
     {"name": "users:read", "display_name": "View Users", "resource": "users", "action": "read"},
     {"name": "users:create", "display_name": "Create Users", "resource": "users", "action": "create"},
@@ -48,10 +58,10 @@ DEFAULT_PERMISSIONS = [
 
     # Admin
     {"name": "admin:access", "display_name": "Admin Panel Access", "resource": "admin", "action": "access"},
-]
+])
 
 # Default roles
-DEFAULT_ROLES = [
+DEFAULT_ROLES: tuple[Mapping[str, Any], ...] = tuple(MappingProxyType(d) for d in [
     {
         "name": "superadmin",
         "display_name": "Super Admin",
@@ -79,126 +89,165 @@ DEFAULT_ROLES = [
         "is_system": True,
         "permissions": []
     },
+])
+
+# Derived once for the IN (...) seeder queries
+_DEFAULT_PERMISSION_NAMES = tuple(d["name"] for d in DEFAULT_PERMISSIONS)
+_DEFAULT_ROLE_NAMES = tuple(d["name"] for d in DEFAULT_ROLES)
+
+# INSERT-ready row shapes, built once at import. values([...]) needs a
+# uniform key set per statement, so the optional keys are normalized
+# here instead of per seed run.
+_PERMISSION_ROWS = [dict(d, is_active=True) for d in DEFAULT_PERMISSIONS]
+_ROLE_ROWS = [
+    {
+        "name": d["name"],
+        "display_name": d["display_name"],
+        "description": d.get("description"),
+        "is_system": d.get("is_system", False),
+        "priority": d.get("priority", 0),
+        "is_active": True,
+    }
+    for d in DEFAULT_ROLES
 ]
+_CONFIG_ROWS = [dict(d, is_secret=d.get("is_secret", False)) for d in DEFAULT_CONFIG]
 
 
 async def seed_permissions(db: AsyncSession) -> dict:
     """Seed default permissions, returns map of name -> Permission."""
-    permission_map = {}
-
-    for perm_data in DEFAULT_PERMISSIONS:
-        result = await db.execute(
-            select(Permission).where(Permission.name == perm_data["name"])
-        )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            permission_map[perm_data["name"]] = existing
-        else:
-            permission = Permission(
-                name=perm_data["name"],
-                display_name=perm_data["display_name"],
-                resource=perm_data["resource"],
-                action=perm_data["action"],
-                is_active=True,
-            )
-            db.add(permission)
-            await db.flush()
-            permission_map[perm_data["name"]] = permission
-            logger.info(f"Created permission: {perm_data['name']}")
+    # Single upsert: Postgres resolves which rows already exist, so a
+    # multi-worker startup can't race a SELECT against an INSERT
+    result = await db.execute(
+        pg_insert(Permission)
+        .values(_PERMISSION_ROWS)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    if result.rowcount:
+        logger.info(f"Created {result.rowcount} permissions")
 
-    return permission_map
+    result = await db.execute(
+        select(Permission).where(Permission.name.in_(_DEFAULT_PERMISSION_NAMES))
+    )
+    return {p.name: p for p in result.scalars()}
 
 
 async def seed_roles(db: AsyncSession, permission_map: dict):
     """Seed default roles with permissions."""
+    # Upsert role metadata in one statement; reseeds refresh the
+    # display/description columns without touching anything else
+    stmt = pg_insert(Role).values(_ROLE_ROWS)
+    # DO UPDATE touches every conflicting row, so RETURNING hands back
+    # the id of every default role — no SELECT-after-insert round trip,
+    # and no need to materialize Role entities at all
+    result = await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "display_name": stmt.excluded.display_name,
+                "description": stmt.excluded.description,
+            },
+        ).returning(Role.id, Role.name)
+    )
+    role_ids = {name: role_id for role_id, name in result}
+
+    # Compute the desired (role_id, permission_id) pairs in memory, then
+    # replace the association rows with two Core statements. Assigning
+    # role.permissions would make the ORM diff old vs new collections and
+    # emit per-row INSERT/DELETE bookkeeping at flush for the same result.
+    assoc_rows = []
     for role_data in DEFAULT_ROLES:
-        result = await db.execute(
-            select(Role)
-            .options(selectinload(Role.permissions))
-            .where(Role.name == role_data["name"])
-        )
-        existing = result.scalar_one_or_none()
+        role_id = role_ids[role_data["name"]]
 
-        if existing:
-            # Update permissions for existing role
-            role = existing
-        else:
-            role = Role(
-                name=role_data["name"],
-                display_name=role_data["display_name"],
-                description=role_data.get("description"),
-                is_system=role_data.get("is_system", False),
-                priority=role_data.get("priority", 0),
-                is_active=True,
-            )
-            db.add(role)
-            await db.flush()
-
-            # Reload with permissions
-            result = await db.execute(
-                select(Role)
-                .options(selectinload(Role.permissions))
-                .where(Role.id == role.id)
-            )
-            role = result.scalar_one()
-            logger.info(f"Created role: {role_data['name']}")
-
-        # Assign permissions ("*" means all permissions)
+        # "*" means all permissions
         perms = role_data.get("permissions", [])
         if perms == "*":
-            role.permissions = list(permission_map.values())
+            perm_objs = list(permission_map.values())
         else:
-            role_perms = []
-            for perm_name in perms:
-                if perm_name in permission_map:
-                    role_perms.append(permission_map[perm_name])
-            role.permissions = role_perms
+            # One dict probe per name instead of membership test + lookup
+            perm_objs = [
+                p for p in map(permission_map.get, perms) if p is not None
+            ]
+            if len(perm_objs) != len(perms):
+                missing = sorted(set(perms) - permission_map.keys())
+                logger.warning(
+                    f"Role {role_data['name']} references unknown permissions: {missing}"
+                )
+        assoc_rows.extend(
+            {"role_id": role_id, "permission_id": p.id} for p in perm_objs
+        )
+
+    await db.execute(
+        delete(role_permissions).where(
+            role_permissions.c.role_id.in_(list(role_ids.values()))
+        )
+    )
+    if assoc_rows:
+        await db.execute(
+            pg_insert(role_permissions)
+            .values(assoc_rows)
+            .on_conflict_do_nothing()
+        )
 
 
 async def seed_superadmin(db: AsyncSession):
     """Create superadmin from environment settings if not exists."""
-    result = await db.execute(
-        select(User).where(User.email == settings.superadmin_email)
+    # Cheap existence probe keeps warm boots from loading the full row
+    # — and, more importantly, from ever reaching the bcrypt call below
+    exists = await db.scalar(
+        select(User.id).where(User.email == settings.superadmin_email)
     )
-    existing = result.scalar_one_or_none()
-
-    if existing:
+    if exists:
         logger.debug(f"Superadmin {settings.superadmin_email} already exists")
         return
 
-    # Get superadmin role
-    result = await db.execute(select(Role).where(Role.name == "superadmin"))
-    superadmin_role = result.scalar_one_or_none()
-
-    user = User(
-        email=settings.superadmin_email,
-        password_hash=pwd_context.hash(settings.superadmin_password),
-        first_name=settings.superadmin_first_name,
-        last_name=settings.superadmin_last_name,
-        is_superadmin=True,
-        is_active=True,
-        email_verified=True,
-        roles=[superadmin_role] if superadmin_role else [],
+    role_id = await db.scalar(select(Role.id).where(Role.name == "superadmin"))
+
+    # ON CONFLICT makes the insert race-safe against a concurrent worker
+    # without a second round trip inside the cold path
+    user_id = await db.scalar(
+        pg_insert(User)
+        .values(
+            email=settings.superadmin_email,
+            # Only computed on first boot; dev environments can drop
+            # BCRYPT_ROUNDS in .env
+            password_hash=hash_password(settings.superadmin_password),
+            first_name=settings.superadmin_first_name,
+            last_name=settings.superadmin_last_name,
+            is_superadmin=True,
+            is_active=True,
+            email_verified=True,
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User.id)
     )
-    db.add(user)
+    if user_id is None:
+        return
+
+    if role_id is not None:
+        await db.execute(
+            pg_insert(user_roles)
+            .values(user_id=user_id, role_id=role_id)
+            .on_conflict_do_nothing()
+        )
     logger.info(f"Created superadmin: {settings.superadmin_email}")
 
 
 async def seed_config(db: AsyncSession):
     """Seed default configuration values."""
-    added = 0
-    for config_data in DEFAULT_CONFIG:
-        result = await db.execute(
-            select(AppConfig).where(AppConfig.key == config_data["key"])
-        )
-        if not result.scalar_one_or_none():
-            config = AppConfig(**config_data)
-            db.add(config)
-            added += 1
+    result = await db.execute(
+        pg_insert(AppConfig)
+        .values(_CONFIG_ROWS)
+        .on_conflict_do_nothing(index_elements=["key"])
+    )
+    if result.rowcount:
+        logger.info(f"Seeded {result.rowcount} default configuration items")
 
-    if added > 0:
-        logger.info(f"Seeded {added} default configuration items")
+
+async def _seed_is_current(db: AsyncSession) -> bool:
+    value = await db.scalar(
+        select(AppConfig.value).where(AppConfig.key == "_seed_version")
+    )
+    return value == str(SEED_VERSION)
 
 
 async def run_startup_tasks(db: AsyncSession):
@@ -213,15 +262,50 @@ async def run_startup_tasks(db: AsyncSession):
         )
         return
 
-    # Seed RBAC
-    permission_map = await seed_permissions(db)
-    await seed_roles(db, permission_map)
+    # Warm restarts skip the whole pipeline after one sentinel read
+    if await _seed_is_current(db):
+        logger.debug(f"Seed data already at version {SEED_VERSION}, skipping")
+        return
 
-    # Seed superadmin
-    await seed_superadmin(db)
+    # Serialize seeding across workers; the lock is released at commit.
+    # Workers that waited here re-check the sentinel and bail.
+    await db.execute(
+        text("SELECT pg_advisory_xact_lock(hashtext('sampleapp_seed'))")
+    )
+    if await _seed_is_current(db):
+        await db.rollback()
+        return
 
-    # Seed config
-    await seed_config(db)
+    # Seed RBAC and config. Config is independent of the RBAC chain, so
+    # it runs concurrently on its own session (a session is not safe for
+    # concurrent use) and its round trips overlap the role seeding.
+    async def _seed_rbac():
+        permission_map = await seed_permissions(db)
+        await seed_roles(db, permission_map)
+        await seed_superadmin(db)
+
+    async def _seed_config():
+        async with AsyncSessionLocal() as config_db:
+            await seed_config(config_db)
+            await config_db.commit()
+
+    await asyncio.gather(_seed_rbac(), _seed_config())
+
+    # Record completion so the next boot stops at the sentinel read
+    await db.execute(
+        pg_insert(AppConfig)
+        .values(
+            key="_seed_version",
+            value=str(SEED_VERSION),
+            description="Internal: last completed startup seed version",
+            category="general",
+            value_type="int",
+            is_editable=False,
+        )
+        .on_conflict_do_update(
+            index_elements=["key"], set_={"value": str(SEED_VERSION)}
+        )
+    )
 
     await db.commit()
     logger.info("Startup initialization complete")
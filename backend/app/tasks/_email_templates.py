@@ -0,0 +1,119 @@
+"""
+Precompiled email bodies for the Celery email tasks.
+
+The templates are compiled to Jinja2 bytecode once at import, so each
+task invocation only pays for .render() — no per-message parsing of the
+markup, and prefork workers inherit the compiled templates via
+copy-on-write. HTML goes through an autoescaping environment; the plain
+text alternatives must not be HTML-escaped, so they use a separate one.
+"""
+from jinja2 import BaseLoader, Environment
+
+_HTML_ENV = Environment(loader=BaseLoader(), autoescape=True)
+_TEXT_ENV = Environment(loader=BaseLoader(), autoescape=False)
+
+
+RESET_HTML = _HTML_ENV.from_string("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .button {
+            display: inline-block;
+            padding: 12px 24px;
+            background-color: #007bff;
+            color: white !important;
+            text-decoration: none;
+            border-radius: 4px;
+            margin: 20px 0;
+        }
+        .footer { margin-top: 30px; font-size: 12px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h2>Password Reset Request</h2>
+        <p>Hello {{ username }},</p>
+        <p>We received a request to reset your password for your {{ app_name }} account.</p>
+        <p>Click the button below to reset your password:</p>
+        <a href="{{ reset_url }}" class="button">Reset Password</a>
+        <p>Or copy and paste this link into your browser:</p>
+        <p style="word-break: break-all; color: #666;">{{ reset_url }}</p>
+        <p><strong>This link will expire in {{ expire_minutes }} minutes.</strong></p>
+        <p>If you didn't request a password reset, you can safely ignore this email.</p>
+        <div class="footer">
+            <p>This is an automated message from {{ app_name }}.</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+RESET_TEXT = _TEXT_ENV.from_string("""\
+Password Reset Request
+
+Hello {{ username }},
+
+We received a request to reset your password for your {{ app_name }} account.
+
+Click the link below to reset your password:
+{{ reset_url }}
+
+This link will expire in {{ expire_minutes }} minutes.
+
+If you didn't request a password reset, you can safely ignore this email.
+
+This is an automated message from {{ app_name }}.
+""")
+
+WELCOME_HTML = _HTML_ENV.from_string("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .button {
+            display: inline-block;
+            padding: 12px 24px;
+            background-color: #28a745;
+            color: white !important;
+            text-decoration: none;
+            border-radius: 4px;
+            margin: 20px 0;
+        }
+        .footer { margin-top: 30px; font-size: 12px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h2>Welcome to {{ app_name }}!</h2>
+        <p>Hello {{ username }},</p>
+        <p>Thank you for creating an account with us. We're excited to have you on board!</p>
+        <p>Your account is now active and ready to use.</p>
+        <a href="{{ login_url }}" class="button">Login to Your Account</a>
+        <div class="footer">
+            <p>This is an automated message from {{ app_name }}.</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+WELCOME_TEXT = _TEXT_ENV.from_string("""\
+Welcome to {{ app_name }}!
+
+Hello {{ username }},
+
+Thank you for creating an account with us. We're excited to have you on board!
+
+Your account is now active and ready to use.
+
+Login here: {{ login_url }}
+
+This is an automated message from {{ app_name }}.
+""")
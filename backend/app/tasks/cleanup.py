@@ -0,0 +1,44 @@
+"""
+Periodic database cleanup tasks.
+
+Scheduled via Celery beat (see celery_app.beat_schedule). Keeping dead
+password-reset rows pruned keeps the token btree and its partial index
+small, so the hot reset-password lookup stays a single index probe.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.models.password_reset import PasswordResetToken
+from app.tasks.celery_app import celery_app
+
+
+async def _purge_expired_reset_tokens() -> int:
+    # Each beat run gets its own asyncio.run() loop, so the shared
+    # AsyncSessionLocal pool would hand back connections bound to the
+    # previous run's closed loop. A NullPool engine opens one connection
+    # for the DELETE and is fully torn down before the loop exits.
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    try:
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as db:
+            result = await db.execute(
+                delete(PasswordResetToken).where(
+                    PasswordResetToken.expires_at < datetime.utcnow() - timedelta(days=1)
+                )
+            )
+            await db.commit()
+            return result.rowcount
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task
+def purge_expired_reset_tokens() -> dict:
+    """Delete password reset tokens that expired more than a day ago."""
+    deleted = asyncio.run(_purge_expired_reset_tokens())
+    return {"status": "success", "deleted": deleted}
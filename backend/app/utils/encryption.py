@@ -3,25 +3,28 @@ Encryption utilities for sensitive data (VHI credentials, etc.)
 Uses Fernet symmetric encryption with the app's secret key.
 """
 import base64
+import functools
 import hashlib
 from cryptography.fernet import Fernet
 from app.config import settings
 
-
-def _get_fernet_key() -> bytes:
-    """
-    Derive a valid Fernet key from the app's secret key.
-    Fernet requires a 32-byte base64-encoded key.
-    """
-    # Use SHA256 to derive a 32-byte key from the secret
-    key_bytes = hashlib.sha256(settings.secret_key.encode()).digest()
-    # Fernet requires base64-encoded key
-    return base64.urlsafe_b64encode(key_bytes)
+# Fernet tokens are version 0x80 + timestamp, which base64-encodes to
+# this fixed prefix; bound once so the hot-path checks share it
+_FERNET_PREFIX = "gAAAAA"
 
 
+@functools.lru_cache(maxsize=1)
 def _get_fernet() -> Fernet:
-    """Get Fernet instance for encryption/decryption"""
-    return Fernet(_get_fernet_key())
+    """Get the process-wide Fernet instance.
+
+    The secret key is fixed for the process lifetime, so the SHA-256
+    derivation, base64 encode, and Fernet construction (which builds its
+    own AES/HMAC contexts) happen once instead of per encrypt/decrypt.
+    A settings-reload hook can call _get_fernet.cache_clear() if key
+    rotation is ever introduced.
+    """
+    key_bytes = hashlib.sha256(settings.secret_key.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key_bytes))
 
 
 def encrypt_string(plaintext: str) -> str:
@@ -55,6 +58,11 @@ def decrypt_string(ciphertext: str) -> str:
     if not ciphertext:
         return ciphertext
 
+    # Legacy plaintext columns short-circuit on the 6-char prefix check
+    # instead of paying encode + Fernet.decrypt + InvalidToken per load
+    if not ciphertext.startswith(_FERNET_PREFIX):
+        return ciphertext
+
     try:
         fernet = _get_fernet()
         decrypted = fernet.decrypt(ciphertext.encode())
@@ -64,6 +72,40 @@ def decrypt_string(ciphertext: str) -> str:
         return ciphertext
 
 
+def encrypt_many(values: list) -> list:
+    """
+    Encrypt a list of strings, reusing one Fernet instance.
+
+    Amortizes the per-call dispatch overhead when a loop encrypts many
+    credential fields; empty/None entries pass through unchanged, same
+    as encrypt_string.
+    """
+    fernet = _get_fernet()
+    return [fernet.encrypt(v.encode()).decode() if v else v for v in values]
+
+
+def decrypt_many(ciphertexts: list) -> list:
+    """
+    Decrypt a list of strings, reusing one Fernet instance.
+
+    Entries that aren't Fernet tokens (legacy plaintext columns) come
+    back untouched without paying for a doomed decrypt attempt.
+    """
+    fernet = _get_fernet()
+    prefix = _FERNET_PREFIX  # local bind: the filter loop is the hot part
+    result = []
+    for ciphertext in ciphertexts:
+        if not ciphertext or not ciphertext.startswith(prefix):
+            result.append(ciphertext)
+            continue
+        try:
+            result.append(fernet.decrypt(ciphertext.encode()).decode())
+        except Exception:
+            # Same migration fallback as decrypt_string
+            result.append(ciphertext)
+    return result
+
+
 def is_encrypted(value: str) -> bool:
     """
     Check if a string appears to be Fernet-encrypted.
@@ -71,4 +113,4 @@ def is_encrypted(value: str) -> bool:
     """
     if not value:
         return False
-    return value.startswith("gAAAAA")
+    return value.startswith(_FERNET_PREFIX)
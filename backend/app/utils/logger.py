@@ -8,8 +8,12 @@ Log files:
 
 import logging
 import os
+import queue
+import threading
+
+import orjson
 from datetime import datetime, timedelta
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 
 from app.config import settings
@@ -71,46 +75,88 @@ class DailyRotatingFileHandler(TimedRotatingFileHandler):
         self._cleanup_old_logs()
 
     def _cleanup_old_logs(self) -> None:
-        """Delete log files older than retention_days."""
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
-
-        for log_file in self.log_dir.glob(f"{self.prefix}-*.log"):
-            try:
-                # Extract date from filename
-                date_str = log_file.stem.replace(f"{self.prefix}-", "")
-                file_date = datetime.strptime(date_str, "%Y-%m-%d")
-                if file_date < cutoff_date:
-                    log_file.unlink()
-            except (ValueError, OSError):
-                # Skip files that don't match the date pattern
-                pass
+        """Delete log files older than retention_days.
+
+        One scandir pass comparing mtimes: the directory entries carry
+        their stat results, so this avoids glob's double stat-walk and
+        a strptime on every filename at each rollover.
+        """
+        cutoff_ts = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
+        name_prefix = f"{self.prefix}-"
+
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                try:
+                    if (
+                        entry.name.startswith(name_prefix)
+                        and entry.name.endswith(".log")
+                        and entry.stat().st_mtime < cutoff_ts
+                    ):
+                        os.unlink(entry.path)
+                except OSError:
+                    # Raced with another process or unreadable entry
+                    pass
+
+
+class OrjsonFormatter(logging.Formatter):
+    """JSON log records serialized with orjson.
+
+    Unlike a %-interpolated JSON template, this escapes correctly —
+    quotes or newlines in a message can't break the output — and the
+    serialization runs at C speed on the listener thread.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
 
 
 class AppLogger:
-    """Singleton logger with file rotation and console output."""
+    """Singleton logger with file rotation and console output.
+
+    Handlers sit behind a QueueHandler/QueueListener pair: emitting a
+    record on the request path is just a queue put, while formatting and
+    file writes happen on the listener's background thread — disk
+    latency never blocks the event loop.
+    """
 
     _instance: logging.Logger | None = None
+    _listener: QueueListener | None = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_logger(cls, name: str = "app") -> logging.Logger:
         """Get or create the application logger."""
+        # Unlocked fast path: after first init this is one attribute read
         if cls._instance is not None:
             return cls._instance
 
+        with cls._lock:
+            # Re-check under the lock so concurrent first callers can't
+            # both run setup and double-attach handlers
+            if cls._instance is not None:
+                return cls._instance
+
+            return cls._setup(name)
+
+    @classmethod
+    def _setup(cls, name: str) -> logging.Logger:
         logger = logging.getLogger(name)
         logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
 
-        # Prevent duplicate handlers
-        if logger.handlers:
-            return logger
-
         # Formatter
         if settings.json_logs:
-            formatter = logging.Formatter(
-                '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-                '"logger": "%(name)s", "message": "%(message)s", '
-                '"module": "%(module)s", "function": "%(funcName)s", "line": %(lineno)d}'
-            )
+            formatter = OrjsonFormatter()
         else:
             formatter = logging.Formatter(
                 "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s",
@@ -121,7 +167,6 @@ class AppLogger:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.DEBUG if settings.debug else logging.INFO)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
 
         # App log file handler (all levels)
         app_handler = DailyRotatingFileHandler(
@@ -131,7 +176,6 @@ class AppLogger:
             level=logging.DEBUG,
         )
         app_handler.setFormatter(formatter)
-        logger.addHandler(app_handler)
 
         # Error log file handler (ERROR and above only)
         error_handler = DailyRotatingFileHandler(
@@ -141,11 +185,31 @@ class AppLogger:
             level=logging.ERROR,
         )
         error_handler.setFormatter(formatter)
-        logger.addHandler(error_handler)
+
+        # The logger itself only enqueues; the listener thread fans out
+        # to the real handlers and honors their individual levels
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+
+        cls._listener = QueueListener(
+            log_queue,
+            console_handler,
+            app_handler,
+            error_handler,
+            respect_handler_level=True,
+        )
+        cls._listener.start()
 
         cls._instance = logger
         return logger
 
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flush and stop the background listener (call on app shutdown)."""
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
+
 
 # Convenience function
 def get_logger(name: str = "app") -> logging.Logger:
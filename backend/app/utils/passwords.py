@@ -0,0 +1,39 @@
+"""Shared bcrypt password hashing helpers.
+
+One module owns the KDF calls so auth routes, user routes, and the
+create_admin CLI stay on the same cost factor and hash format ($2b$).
+"""
+import asyncio
+
+import bcrypt
+
+from app.config import settings
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt at the configured cost."""
+    return bcrypt.hashpw(
+        password.encode(), bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    ).decode()
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against its stored hash."""
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+
+# Async wrappers run the KDF on a worker thread; a bcrypt call is ~250ms
+# of pure CPU and would otherwise stall every other request on the loop
+
+async def ahash_password(password: str) -> str:
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+def warmup() -> None:
+    """Exercise the bcrypt backend once so the first real login doesn't
+    pay its lazy initialization on top of the KDF. Low cost on purpose."""
+    bcrypt.hashpw(b"warmup", bcrypt.gensalt(rounds=4))
@@ -29,8 +29,9 @@ Usage examples:
         await delete_vm(vm_id)
 """
 
-from typing import List, Callable
-from functools import wraps
+from enum import StrEnum
+from typing import Callable
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 
 from app.api.auth import get_current_user
@@ -52,10 +53,28 @@ class PermissionDeniedError(HTTPException):
         )
 
 
+@lru_cache(maxsize=None)
+def _require_permission(permission: str) -> Callable:
+    async def permission_checker(
+        current_user: User = Depends(get_current_user)
+    ) -> User:
+        if not current_user.has_permission(permission):
+            raise PermissionDeniedError(permission=permission)
+        return current_user
+
+    return permission_checker
+
+
 def require_permission(permission: str) -> Callable:
     """
     FastAPI dependency that requires a specific permission.
 
+    Memoized so every Depends(require_permission("users:read")) across
+    the route table is the same callable — FastAPI's dependency cache
+    dedupes by identity, and import time stops allocating a closure per
+    route. Enum members normalize to their value so Permissions.X and
+    the raw string share one entry.
+
     Args:
         permission: Permission name in format 'resource:action' (e.g., 'users:read')
 
@@ -65,11 +84,18 @@ def require_permission(permission: str) -> Callable:
     Raises:
         HTTPException 403 if user doesn't have the permission
     """
+    return _require_permission(str(permission))
+
+
+@lru_cache(maxsize=None)
+def _require_any_permission(permissions: tuple) -> Callable:
     async def permission_checker(
         current_user: User = Depends(get_current_user)
     ) -> User:
-        if not current_user.has_permission(permission):
-            raise PermissionDeniedError(permission=permission)
+        if not current_user.has_any_permission(*permissions):
+            raise PermissionDeniedError(
+                permission=" OR ".join(permissions)
+            )
         return current_user
 
     return permission_checker
@@ -85,12 +111,20 @@ def require_any_permission(*permissions: str) -> Callable:
     Returns:
         Dependency function that returns the current user if permitted
     """
+    # Sorted tuple key: order-independent call sites share one checker
+    return _require_any_permission(tuple(sorted(map(str, permissions))))
+
+
+@lru_cache(maxsize=None)
+def _require_all_permissions(permissions: tuple) -> Callable:
     async def permission_checker(
         current_user: User = Depends(get_current_user)
     ) -> User:
-        if not current_user.has_any_permission(*permissions):
+        if not current_user.has_all_permissions(*permissions):
+            # One set difference instead of re-checking each permission
+            missing = sorted(set(permissions) - current_user.get_permissions())
             raise PermissionDeniedError(
-                permission=" OR ".join(permissions)
+                permission=" AND ".join(missing)
             )
         return current_user
 
@@ -107,17 +141,19 @@ def require_all_permissions(*permissions: str) -> Callable:
     Returns:
         Dependency function that returns the current user if permitted
     """
-    async def permission_checker(
+    return _require_all_permissions(tuple(sorted(map(str, permissions))))
+
+
+@lru_cache(maxsize=None)
+def _require_role(role_name: str) -> Callable:
+    async def role_checker(
         current_user: User = Depends(get_current_user)
     ) -> User:
-        if not current_user.has_all_permissions(*permissions):
-            missing = [p for p in permissions if not current_user.has_permission(p)]
-            raise PermissionDeniedError(
-                permission=" AND ".join(missing)
-            )
+        if not current_user.has_role(role_name):
+            raise PermissionDeniedError(role=role_name)
         return current_user
 
-    return permission_checker
+    return role_checker
 
 
 def require_role(role_name: str) -> Callable:
@@ -130,11 +166,18 @@ def require_role(role_name: str) -> Callable:
     Returns:
         Dependency function that returns the current user if permitted
     """
+    return _require_role(str(role_name))
+
+
+@lru_cache(maxsize=None)
+def _require_any_role(role_names: tuple) -> Callable:
     async def role_checker(
         current_user: User = Depends(get_current_user)
     ) -> User:
-        if not current_user.has_role(role_name):
-            raise PermissionDeniedError(role=role_name)
+        if not any(current_user.has_role(role) for role in role_names):
+            raise PermissionDeniedError(
+                role=" OR ".join(role_names)
+            )
         return current_user
 
     return role_checker
@@ -150,16 +193,7 @@ def require_any_role(*role_names: str) -> Callable:
     Returns:
         Dependency function that returns the current user if permitted
     """
-    async def role_checker(
-        current_user: User = Depends(get_current_user)
-    ) -> User:
-        if not any(current_user.has_role(role) for role in role_names):
-            raise PermissionDeniedError(
-                role=" OR ".join(role_names)
-            )
-        return current_user
-
-    return role_checker
+    return _require_any_role(tuple(sorted(map(str, role_names))))
 
 
 # Convenience functions for checking permissions in code (not as dependencies)
@@ -175,8 +209,13 @@ def has_role(user: User, role_name: str) -> bool:
 
 
 # Standard permission constants
-class Permissions:
-    """Standard permission names used across the application"""
+class Permissions(StrEnum):
+    """Standard permission names used across the application.
+
+    A StrEnum member IS its value ("users:read"), so members drop into
+    every str context — set membership, f-strings, lru_cache keys —
+    while typos become AttributeErrors at import instead of silent 403s.
+    """
 
     # Users
     USERS_READ = "users:read"
@@ -257,7 +296,7 @@ class Permissions:
     ADMIN_SETTINGS = "admin:settings"  # System settings
 
 
-class Roles:
+class Roles(StrEnum):
     """Standard role names"""
     ADMIN = "admin"
     SUPPORT = "support"